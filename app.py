@@ -11,6 +11,19 @@ from rowlytics_app.services.weekly_coach_summary import run_weekly_coach_summari
 
 app = create_app()
 
+BASE64_CONTENT_TYPES = frozenset({
+    "image/png",
+    "image/jpeg",
+    "image/jpg",
+    "image/gif",
+    "image/webp",
+    "image/svg+xml",
+    "image/vnd.microsoft.icon",
+    "image/x-icon",
+    "application/octet-stream",
+    "video/webm",
+})
+
 
 def _inject_stage_prefix(event):
     request_context = event.get("requestContext") or {}
@@ -19,8 +32,7 @@ def _inject_stage_prefix(event):
         return event
 
     headers = event.get("headers") or {}
-    header_keys = {key.lower() for key in headers}
-    if "x-forwarded-prefix" not in header_keys:
+    if not any(key.lower() == "x-forwarded-prefix" for key in headers):
         headers["X-Forwarded-Prefix"] = f"/{stage}"
     event["headers"] = headers
     return event
@@ -39,16 +51,5 @@ def lambda_handler(event, context):
         app,
         event,
         context,
-        base64_content_types={
-            "image/png",
-            "image/jpeg",
-            "image/jpg",
-            "image/gif",
-            "image/webp",
-            "image/svg+xml",
-            "image/vnd.microsoft.icon",
-            "image/x-icon",
-            "application/octet-stream",
-            "video/webm",
-        },
+        base64_content_types=BASE64_CONTENT_TYPES,
     )
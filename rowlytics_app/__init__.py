@@ -2,14 +2,40 @@
 
 from __future__ import annotations
 
+import logging
 import os
 
-from flask import Flask, current_app, jsonify, redirect, request, session, url_for
+from flask import Flask, current_app, g, redirect, request, session, url_for
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-from .api_routes import api_bp
+from .api_routes import api_bp, auth_required_response
+from .json_provider import install_json_provider
 from .logging_config import setup_logging
 from .routes import public_bp
+from .services.dynamodb import get_ddb_tables, get_recordings_table, get_teams_table
+from .services.s3 import get_s3_client
+
+# Endpoints reachable without a session; the API health check stays public
+# so uptime probes can test connectivity.
+_PUBLIC_ENDPOINTS = frozenset({
+    "static",
+    "public.signin",
+    "public.auth_callback",
+    "public.logout",
+    "public.favicon_redirect",
+    "api.health_check",
+})
+
+
+def _warm_aws_clients(app: Flask) -> None:
+    """Build AWS handles during Lambda INIT instead of on the first billed request."""
+    try:
+        get_ddb_tables()
+        get_teams_table()
+        get_recordings_table()
+        get_s3_client()
+    except Exception as err:
+        app.logger.warning("AWS client warm-up skipped: %s", err)
 
 
 def create_app() -> Flask:
@@ -18,6 +44,7 @@ def create_app() -> Flask:
     # Initialize logging first
     setup_logging(app)
 
+    install_json_provider(app)
     app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
     app.config.from_mapping(
         SECRET_KEY=os.getenv("ROWLYTICS_SECRET_KEY", "dev-secret-key"),
@@ -58,35 +85,28 @@ def create_app() -> Flask:
 
     @app.before_request
     def require_auth():
-        current_app.logger.info(
-            "request path=%s method=%s user=%s",
-            request.path,
-            request.method,
-            session.get("user_id"),
-        )
+        endpoint = request.endpoint
+        user_id = g.user_id = session.get("user_id")
+        if current_app.logger.isEnabledFor(logging.INFO):
+            current_app.logger.info(
+                "request path=%s method=%s user=%s",
+                request.path,
+                request.method,
+                user_id,
+            )
         if not app.config.get("AUTH_REQUIRED"):
             return None
-        if request.endpoint == "static" or "/static/" in request.path:
-            return None
-        if request.endpoint in {
-            "public.signin",
-            "public.auth_callback",
-            "public.logout",
-            "public.favicon_redirect",
-        }:
+        if endpoint in _PUBLIC_ENDPOINTS or "/static/" in request.path:
             return None
         if request.path.startswith("/api/"):
-            # Allow health check without authentication
-            if request.path == "/api/health":
-                return None
-            if not session.get("user_id"):
-                return jsonify({"error": "authentication required"}), 401
+            if not user_id:
+                return auth_required_response()
             return None
-        if not session.get("user_id"):
+        if not user_id:
             return redirect(url_for("public.signin"))
         if (
             session.get("display_name_required")
-            and request.endpoint != "public.display_name_setup"
+            and endpoint != "public.display_name_setup"
         ):
             return redirect(url_for("public.display_name_setup"))
         return None
@@ -94,4 +114,7 @@ def create_app() -> Flask:
     app.register_blueprint(public_bp)
     app.register_blueprint(api_bp)
 
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        _warm_aws_clients(app)
+
     return app
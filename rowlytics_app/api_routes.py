@@ -5,21 +5,30 @@ import json
 import logging
 import math
 import os
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from uuid import uuid4
 
-from flask import Blueprint, jsonify, request, session
+from flask import Blueprint, Response, jsonify, request, session
 
 try:
     from botocore.exceptions import ClientError
 except ImportError:  # pragma: no cover - boto3 only needed when AWS is used
     ClientError = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 from rowlytics_app.auth.cognito import delete_cognito_user
+from rowlytics_app.auth.sessions import current_user_id
 from rowlytics_app.cv.alignment import PracticeStrokeAssembler
 from rowlytics_app.cv.feature_extraction.angles import normalized_joint_angle
 from rowlytics_app.services.dynamodb import (
+    batch_delete_items,
+    build_page_member,
     display_name_exists,
     fetch_team_members,
     fetch_team_members_page,
@@ -32,7 +41,11 @@ from rowlytics_app.services.dynamodb import (
     get_teams_table,
     get_workout_for_user,
     get_workouts_table,
-    list_recordings,
+    invalidate_team,
+    invalidate_team_members,
+    invalidate_team_membership,
+    invalidate_user_team_roster,
+    iter_recording_key_pages,
     list_recordings_page,
     list_team_members_by_team,
     list_team_memberships,
@@ -40,12 +53,21 @@ from rowlytics_app.services.dynamodb import (
     list_workouts_page,
     normalize_display_name,
     now_iso,
+    put_team_membership,
+    put_team_with_owner,
     resolve_user_by_identifier,
     sum_recording_durations_for_utc_date,
     team_name_exists,
+    transaction_cancellation_codes,
     update_email_update_interval,
 )
-from rowlytics_app.services.s3 import UPLOAD_BUCKET_NAME, get_s3_client
+from rowlytics_app.services.fanout import run_fanout
+from rowlytics_app.services.s3 import (
+    UPLOAD_BUCKET_NAME,
+    delete_object_keys,
+    get_s3_client,
+    presign_playback_url,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -395,9 +417,17 @@ def _collect_weekly_workouts(
     return weekly_workouts, points
 
 
+def _clean_str(data, key: str, default: str = "") -> str:
+    """Return ``data[key]`` stripped, or ``default`` when it is missing, empty or not a string."""
+    value = data.get(key)
+    if not value or not isinstance(value, str):
+        return default
+    return value.strip()
+
+
 def _resolve_recording_user_id(data):
-    requested_user_id = (data.get("userId") or "").strip()
-    session_user_id = (session.get("user_id") or "").strip()
+    requested_user_id = _clean_str(data, "userId")
+    session_user_id = current_user_id()
 
     if session_user_id:
         if requested_user_id and requested_user_id != session_user_id:
@@ -1644,8 +1674,12 @@ def _parse_limit(raw_limit: str | None, default: int) -> int:
 def _encode_cursor(last_evaluated_key: dict | None) -> str | None:
     if not last_evaluated_key:
         return None
-    payload = json.dumps(last_evaluated_key, separators=(",", ":")).encode("utf-8")
-    return base64.urlsafe_b64encode(payload).decode("ascii")
+    if orjson is not None:
+        payload = orjson.dumps(last_evaluated_key)
+    else:
+        payload = json.dumps(last_evaluated_key, separators=(",", ":")).encode("utf-8")
+    # Padding is restored on decode, so drop it to keep "=" out of query strings.
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
 
 
 def _decode_cursor(cursor: str | None) -> dict | None:
@@ -1654,7 +1688,7 @@ def _decode_cursor(cursor: str | None) -> dict | None:
     try:
         padding = "=" * (-len(cursor) % 4)
         decoded = base64.urlsafe_b64decode((cursor + padding).encode("ascii"))
-        payload = json.loads(decoded.decode("utf-8"))
+        payload = orjson.loads(decoded) if orjson is not None else json.loads(decoded)
     except Exception as err:
         raise ValueError("cursor is invalid") from err
     if not isinstance(payload, dict):
@@ -1803,11 +1837,24 @@ def _summarize_team_workouts(workouts_table, memberships: list[dict]) -> dict:
     }
 
 
+_HEALTH_BODY = b'{"service":"rowlytics-api","status":"ok"}\n'
+_AUTH_REQUIRED_BODY = b'{"error":"authentication required"}\n'
+
+
+def auth_required_response() -> Response:
+    """401 for unauthenticated API calls, built from a pre-encoded body."""
+    return Response(_AUTH_REQUIRED_BODY, status=401, mimetype="application/json")
+
+
 @api_bp.route("/health", methods=["GET"])
 def health_check():
     """Simple health check endpoint - no auth required to test API connectivity."""
-    logger.info("GET /api/health: health check")
-    return jsonify({"status": "ok", "service": "rowlytics-api"}), 200
+    logger.debug("GET /api/health: health check")
+    return Response(
+        _HEALTH_BODY,
+        mimetype="application/json",
+        headers={"Cache-Control": "public, max-age=5"},
+    )
 
 
 @api_bp.route("/teams/<team_id>/members", methods=["GET"])
@@ -1847,12 +1894,11 @@ def add_team_member(team_id):
         return jsonify({"error": "team_id is required"}), 400
 
     data = request.get_json(silent=True) or {}
-    user_identifier = (data.get("userLookup") or data.get("userId") or "").strip()
+    user_identifier = _clean_str(data, "userLookup") or _clean_str(data, "userId")
     if not user_identifier:
         return jsonify({"error": "display name or user ID is required"}), 400
 
-    member_role = (data.get("memberRole") or "rower").strip()
-    member_role = member_role.lower()
+    member_role = _clean_str(data, "memberRole", "rower").lower()
     if member_role not in ALLOWED_TEAM_ROLES:
         return jsonify({"error": "memberRole must be coach or rower"}), 400
 
@@ -1860,6 +1906,7 @@ def add_team_member(team_id):
 
     try:
         users_table, team_members_table = get_ddb_tables()
+        teams_table = get_teams_table()
     except RuntimeError as err:
         return jsonify({"error": str(err)}), 500
 
@@ -1878,7 +1925,7 @@ def add_team_member(team_id):
         return jsonify({"error": "User does not exist"}), 404
 
     try:
-        existing_membership = get_team_membership(team_members_table, user_id)
+        existing_membership = get_team_membership(team_members_table, user_id, use_cache=False)
     except Exception as err:
         return jsonify({"error": "Unable to check user team", "detail": str(err)}), 500
 
@@ -1899,29 +1946,28 @@ def add_team_member(team_id):
     }
 
     try:
-        team_members_table.put_item(
-            Item=item,
-            ConditionExpression="attribute_not_exists(teamId) AND attribute_not_exists(userId)",
-        )
+        put_team_membership(teams_table, team_members_table, item)
     except Exception as err:
-        error_code = None
-        if ClientError and isinstance(err, ClientError):
-            error_code = err.response.get("Error", {}).get("Code")
-        if error_code == "ConditionalCheckFailedException":
+        codes = transaction_cancellation_codes(err)
+        if codes[:1] == ["ConditionalCheckFailed"]:
+            return jsonify({"error": "Team not found"}), 404
+        if codes[1:2] == ["ConditionalCheckFailed"]:
             return jsonify({"error": "User already on team"}), 409
         return jsonify({"error": "Unable to add team member", "detail": str(err)}), 500
 
+    invalidate_team_members(team_id)
+    invalidate_team_membership(user_id)
     return jsonify({"status": "ok", "teamId": team_id, "userId": user_id}), 201
 
 
 @api_bp.route("/team/current", methods=["GET"])
 def current_team():
-    user_id = session.get("user_id")
-    logger.info(f"GET /team/current: user={user_id}")
+    user_id = current_user_id()
+    logger.info("GET /team/current: user=%s", user_id)
 
     if not user_id:
         logger.warning("GET /team/current: authentication required")
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     try:
         limit = _parse_limit(request.args.get("limit"), TEAM_MEMBERS_PAGE_SIZE)
@@ -1934,27 +1980,27 @@ def current_team():
         users_table, team_members_table = get_ddb_tables()
         teams_table = get_teams_table()
     except RuntimeError as err:
-        logger.error(f"GET /team/current: DynamoDB tables not available: {err}")
+        logger.error("GET /team/current: DynamoDB tables not available: %s", err)
         return jsonify({"error": str(err)}), 500
 
     try:
-        logger.debug(f"GET /team/current: fetching membership for user {user_id}")
+        logger.debug("GET /team/current: fetching membership for user %s", user_id)
         membership = get_team_membership(team_members_table, user_id)
     except Exception as err:
-        logger.error(f"GET /team/current: failed to load membership: {err}", exc_info=True)
+        logger.error("GET /team/current: failed to load membership: %s", err, exc_info=True)
         return jsonify({"error": "Unable to load team", "detail": str(err)}), 500
 
     if not membership:
-        logger.info(f"GET /team/current: user {user_id} not on a team")
+        logger.info("GET /team/current: user %s not on a team", user_id)
         return jsonify({"teamId": None, "members": [], "nextCursor": None})
 
     team_id = membership.get("teamId")
-    logger.debug(f"GET /team/current: user {user_id} is on team {team_id}")
+    logger.debug("GET /team/current: user %s is on team %s", user_id, team_id)
 
     try:
         team = get_team(teams_table, team_id)
     except Exception as err:
-        logger.error(f"GET /team/current: failed to load team metadata: {err}", exc_info=True)
+        logger.error("GET /team/current: failed to load team metadata: %s", err, exc_info=True)
         return jsonify({"error": "Unable to load team", "detail": str(err)}), 500
 
     try:
@@ -1972,7 +2018,7 @@ def current_team():
             len(members),
         )
     except Exception as err:
-        logger.error(f"GET /team/current: failed to load team members: {err}", exc_info=True)
+        logger.error("GET /team/current: failed to load team members: %s", err, exc_info=True)
         return jsonify({"error": "Unable to load team members", "detail": str(err)}), 500
 
     payload = {
@@ -2015,9 +2061,9 @@ def current_team():
 
 @api_bp.route("/team/stats/weekly", methods=["GET"])
 def weekly_team_stats():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     window_end = _now_utc()
     window_start = window_end - timedelta(days=7)
@@ -2048,7 +2094,12 @@ def weekly_team_stats():
         return jsonify({"error": "Unable to load team membership", "detail": str(err)}), 500
 
     try:
-        user_workouts = list_workouts(workouts_table, user_id)
+        user_workouts = list_workouts(
+            workouts_table,
+            user_id,
+            completed_from=window_start,
+            completed_to=window_end,
+        )
     except Exception as err:
         return jsonify({"error": "Unable to load workouts", "detail": str(err)}), 500
 
@@ -2092,7 +2143,12 @@ def weekly_team_stats():
 
             member_display_name = member.get("name") or member_user_id
             try:
-                member_workouts = list_workouts(workouts_table, member_user_id)
+                member_workouts = list_workouts(
+                    workouts_table,
+                    member_user_id,
+                    completed_from=window_start,
+                    completed_to=window_end,
+                )
             except Exception as err:
                 return jsonify({
                     "error": "Unable to load team workouts",
@@ -2130,21 +2186,37 @@ def weekly_team_stats():
     })
 
 
+def _first_members_page(users_table, team_members_table, team_id: str, limit: int):
+    members, next_key = fetch_team_members_page(
+        users_table,
+        team_members_table,
+        team_id,
+        ALLOWED_TEAM_ROLES,
+        limit=limit,
+    )
+    return members, _encode_cursor(next_key)
+
+
 @api_bp.route("/team/join", methods=["POST"])
 def join_team():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     data = request.get_json(silent=True) or {}
-    team_name = (data.get("teamName") or "").strip()
+    team_name = _clean_str(data, "teamName")
     if not team_name:
         return jsonify({"error": "teamName is required"}), 400
 
-    member_role = (data.get("memberRole") or "rower").strip().lower()
+    member_role = _clean_str(data, "memberRole", "rower").lower()
     if member_role not in ALLOWED_TEAM_ROLES:
         return jsonify({"error": "memberRole must be coach or rower"}), 400
 
+    try:
+        limit = _parse_limit(request.args.get("limit"), TEAM_MEMBERS_PAGE_SIZE)
+    except ValueError as err:
+        return jsonify({"error": str(err)}), 400
+
     joined_at = data.get("joinedAt") or now_iso()
 
     try:
@@ -2153,15 +2225,20 @@ def join_team():
     except RuntimeError as err:
         return jsonify({"error": str(err)}), 500
 
-    team_item = get_team_by_name(teams_table, team_name)
+    # The team lookup and the user's membership check are independent reads.
+    (team_item, team_err), (existing, membership_err) = run_fanout(_capture, [
+        lambda: get_team_by_name(teams_table, team_name),
+        lambda: get_team_membership(team_members_table, user_id, use_cache=False),
+    ])
+    if team_err is not None:
+        raise team_err
     if not team_item:
         return jsonify({"error": "Team not found"}), 404
     team_id = team_item.get("teamId")
 
-    try:
-        existing = get_team_membership(team_members_table, user_id)
-    except Exception as err:
-        return jsonify({"error": "Unable to check current team", "detail": str(err)}), 500
+    if membership_err is not None:
+        detail = str(membership_err)
+        return jsonify({"error": "Unable to check current team", "detail": detail}), 500
 
     if existing and existing.get("teamId") != team_id:
         return jsonify({
@@ -2169,18 +2246,6 @@ def join_team():
             "teamId": existing.get("teamId"),
         }), 409
 
-    if existing and existing.get("teamId") == team_id:
-        try:
-            members = fetch_team_members(
-                users_table,
-                team_members_table,
-                team_id,
-                ALLOWED_TEAM_ROLES,
-            )
-        except Exception as err:
-            return jsonify({"error": "Unable to load team members", "detail": str(err)}), 500
-        return jsonify({"status": "ok", "teamId": team_id, "members": members})
-
     if not existing:
         item = {
             "teamId": team_id,
@@ -2189,53 +2254,66 @@ def join_team():
             "joinedAt": joined_at,
         }
         try:
-            team_members_table.put_item(
-                Item=item,
-                ConditionExpression="attribute_not_exists(teamId) AND attribute_not_exists(userId)",
-            )
+            put_team_membership(teams_table, team_members_table, item)
         except Exception as err:
-            error_code = None
-            if ClientError and isinstance(err, ClientError):
-                error_code = err.response.get("Error", {}).get("Code")
-            if error_code != "ConditionalCheckFailedException":
+            codes = transaction_cancellation_codes(err)
+            if codes[:1] == ["ConditionalCheckFailed"]:
+                return jsonify({"error": "Team not found"}), 404
+            if codes[1:2] != ["ConditionalCheckFailed"]:
                 return jsonify({"error": "Unable to join team", "detail": str(err)}), 500
+        invalidate_team_members(team_id)
+        invalidate_team_membership(user_id)
 
     try:
-        members = fetch_team_members(
-            users_table,
-            team_members_table,
-            team_id,
-            ALLOWED_TEAM_ROLES,
+        members, next_cursor = _first_members_page(
+            users_table, team_members_table, team_id, limit
         )
     except Exception as err:
         return jsonify({"error": "Unable to load team members", "detail": str(err)}), 500
 
-    return jsonify({"status": "ok", "teamId": team_id, "members": members})
+    return jsonify({
+        "status": "ok",
+        "teamId": team_id,
+        "members": members,
+        "nextCursor": next_cursor,
+    })
 
 
 @api_bp.route("/team/create", methods=["POST"])
 def create_team():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     data = request.get_json(silent=True) or {}
-    team_name = (data.get("teamName") or "").strip()
+    team_name = _clean_str(data, "teamName")
     if not team_name:
         return jsonify({"error": "teamName is required"}), 400
 
-    created_at = data.get("createdAt") or now_iso()
+    # createdAt is the CoachUserIdIndex sort key (type S), so anything the
+    # client sends is parsed to UTC ISO or replaced with the current time.
+    created_at, _ = _normalize_event_timestamp(data.get("createdAt"))
 
     try:
-        users_table, team_members_table = get_ddb_tables()
+        _, team_members_table = get_ddb_tables()
         teams_table = get_teams_table()
     except RuntimeError as err:
         return jsonify({"error": str(err)}), 500
 
-    try:
-        existing = get_team_membership(team_members_table, user_id)
-    except Exception as err:
-        return jsonify({"error": "Unable to check current team", "detail": str(err)}), 500
+    # The owner's profile is read alongside the checks so the response can
+    # list them like any other roster member without a second round-trip.
+    (
+        (existing, membership_err),
+        (name_taken, name_err),
+        (profile, profile_err),
+    ) = run_fanout(_capture, [
+        lambda: get_team_membership(team_members_table, user_id, use_cache=False),
+        lambda: team_name_exists(teams_table, team_name),
+        lambda: fetch_user_profile(user_id),
+    ])
+    if membership_err is not None:
+        detail = str(membership_err)
+        return jsonify({"error": "Unable to check current team", "detail": detail}), 500
 
     if existing:
         return jsonify({
@@ -2243,13 +2321,12 @@ def create_team():
             "teamId": existing.get("teamId"),
         }), 409
 
-    try:
-        if team_name_exists(teams_table, team_name):
-            return jsonify({"error": "Team name already exists"}), 409
-    except Exception as err:
-        return jsonify({"error": "Unable to check team name", "detail": str(err)}), 500
+    if name_err is not None:
+        return jsonify({"error": "Unable to check team name", "detail": str(name_err)}), 500
+    if name_taken:
+        return jsonify({"error": "Team name already exists"}), 409
 
-    team_id = uuid4().hex
+    team_id = secrets.token_hex(16)
     team_item = {
         "teamId": team_id,
         "teamName": team_name,
@@ -2257,14 +2334,6 @@ def create_team():
         "createdAt": created_at,
     }
 
-    try:
-        teams_table.put_item(
-            Item=team_item,
-            ConditionExpression="attribute_not_exists(teamId)",
-        )
-    except Exception as err:
-        return jsonify({"error": "Unable to create team", "detail": str(err)}), 500
-
     member_item = {
         "teamId": team_id,
         "userId": user_id,
@@ -2273,36 +2342,39 @@ def create_team():
     }
 
     try:
-        team_members_table.put_item(
-            Item=member_item,
-            ConditionExpression="attribute_not_exists(teamId) AND attribute_not_exists(userId)",
-        )
-    except Exception as err:
-        return jsonify({"error": "Unable to add team owner", "detail": str(err)}), 500
-
-    try:
-        members = fetch_team_members(
-            users_table,
-            team_members_table,
-            team_id,
-            ALLOWED_TEAM_ROLES,
-        )
+        put_team_with_owner(teams_table, team_members_table, team_item, member_item)
     except Exception as err:
-        return jsonify({"error": "Unable to load team members", "detail": str(err)}), 500
-
+        # With a random teamId neither condition should fail in practice, but
+        # a cancelled membership put (index 1) is reported like the pre-check
+        # above rather than as a server error. A team-row conflict (index 0)
+        # would be an id collision and stays a 500.
+        codes = transaction_cancellation_codes(err)
+        if codes[1:2] == ["ConditionalCheckFailed"]:
+            return jsonify({"error": "Already on a team. Leave your current team first."}), 409
+        return jsonify({"error": "Unable to create team", "detail": str(err)}), 500
+    invalidate_team_members(team_id)
+    invalidate_team_membership(user_id)
+
+    # A brand-new team's only member is its creator, so answer from the row
+    # just written and their profile instead of re-reading the roster.
+    if profile_err is not None:
+        logger.warning("POST /team/create: unable to load owner profile: %s", profile_err)
+        profile = {"name": session.get("user_name"), "email": session.get("user_email")}
+    owner = build_page_member(member_item, profile, ALLOWED_TEAM_ROLES)
     return jsonify({
         "status": "ok",
         "teamId": team_id,
         "teamName": team_name,
-        "members": members,
+        "members": [owner],
+        "nextCursor": None,
     }), 201
 
 
 @api_bp.route("/team/leave", methods=["DELETE"])
 def leave_team():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     try:
         _, team_members_table = get_ddb_tables()
@@ -2311,7 +2383,7 @@ def leave_team():
         return jsonify({"error": str(err)}), 500
 
     try:
-        membership = get_team_membership(team_members_table, user_id)
+        membership = get_team_membership(team_members_table, user_id, use_cache=False)
     except Exception as err:
         return jsonify({"error": "Unable to check current team", "detail": str(err)}), 500
 
@@ -2329,10 +2401,13 @@ def leave_team():
         team_members_table.delete_item(Key={"teamId": team_id, "userId": user_id})
     except Exception as err:
         return jsonify({"error": "Unable to leave team", "detail": str(err)}), 500
+    invalidate_team_members(team_id)
+    invalidate_team_membership(user_id)
 
     if deleted_team:
         try:
             teams_table.delete_item(Key={"teamId": team_id})
+            invalidate_team(team_id)
         except Exception as err:
             return jsonify({
                 "error": "Left team but failed to delete empty team",
@@ -2342,19 +2417,24 @@ def leave_team():
     return jsonify({"status": "ok", "teamId": team_id, "deletedTeam": deleted_team})
 
 
+_UPDATE_NAME_EXPR = "SET #name = :name, nameKey = :nameKey, updatedAt = :updatedAt"
+_UPDATE_NAME_AND_EMAIL_EXPR = _UPDATE_NAME_EXPR + ", email = if_not_exists(email, :email)"
+_NAME_ATTRIBUTE_NAMES = {"#name": "name"}
+
+
 @api_bp.route("/account/name", methods=["POST"])
 def update_account_name():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     data = request.get_json(silent=True) or {}
-    name = (data.get("name") or "").strip()
+    name = _clean_str(data, "name")
     if not name:
         return jsonify({"error": "name is required"}), 400
 
     try:
-        users_table, _ = get_ddb_tables()
+        users_table, team_members_table = get_ddb_tables()
     except RuntimeError as err:
         return jsonify({"error": str(err)}), 500
 
@@ -2364,28 +2444,28 @@ def update_account_name():
     except Exception as err:
         return jsonify({"error": "Unable to check display name", "detail": str(err)}), 500
 
-    update_expr = "SET #name = :name, nameKey = :nameKey, updatedAt = :updatedAt"
-    expr_attr_names = {"#name": "name"}
     expr_attr_values = {
         ":name": name,
         ":nameKey": normalize_display_name(name),
         ":updatedAt": now_iso(),
     }
-
+    update_expr = _UPDATE_NAME_EXPR
     user_email = session.get("user_email")
     if user_email:
-        update_expr += ", email = if_not_exists(email, :email)"
+        update_expr = _UPDATE_NAME_AND_EMAIL_EXPR
         expr_attr_values[":email"] = user_email
 
     try:
         users_table.update_item(
             Key={"userId": user_id},
             UpdateExpression=update_expr,
-            ExpressionAttributeNames=expr_attr_names,
+            ExpressionAttributeNames=_NAME_ATTRIBUTE_NAMES,
             ExpressionAttributeValues=expr_attr_values,
+            ReturnValues="NONE",
         )
     except Exception as err:
         return jsonify({"error": "Unable to update name", "detail": str(err)}), 500
+    invalidate_user_team_roster(team_members_table, user_id)
 
     session["user_name"] = name
     session["display_name_required"] = False
@@ -2394,9 +2474,9 @@ def update_account_name():
 
 @api_bp.route("/account/email-updates", methods=["POST"])
 def update_account_email_updates():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     data = request.get_json(silent=True) or {}
     interval_value = data.get("value")
@@ -2422,9 +2502,9 @@ def update_account_email_updates():
 
 @api_bp.route("/account/profile", methods=["GET"])
 def get_account_profile():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     try:
         profile = fetch_user_profile(user_id)
@@ -2447,11 +2527,19 @@ def get_account_profile():
     })
 
 
+def _capture(task):
+    """Run ``task`` and return ``(result, None)``, or ``(None, error)`` if it raised."""
+    try:
+        return task(), None
+    except Exception as err:
+        return None, err
+
+
 @api_bp.route("/account/delete", methods=["POST"])
 def delete_account():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     try:
         users_table, team_members_table = get_ddb_tables()
@@ -2463,41 +2551,62 @@ def delete_account():
     except Exception as err:
         return jsonify({"error": "Unable to delete Cognito user", "detail": str(err)}), 500
 
-    recordings_table = None
-    s3 = None
     try:
         recordings_table = get_recordings_table()
-        s3 = get_s3_client()
     except RuntimeError:
         recordings_table = None
-        s3 = None
-
-    if recordings_table is not None:
-        try:
-            recordings = list_recordings(recordings_table, user_id)
-        except Exception as err:
-            return jsonify({"error": "Unable to load recordings", "detail": str(err)}), 500
-
-        for item in recordings:
-            recording_id = item.get("recordingId")
-            object_key = item.get("objectKey")
-            if s3 and object_key:
-                try:
-                    s3.delete_object(Bucket=UPLOAD_BUCKET_NAME, Key=object_key)
-                except Exception:
-                    pass
-            if recording_id:
-                recordings_table.delete_item(Key={"userId": user_id, "recordingId": recording_id})
 
-    try:
-        memberships = list_team_memberships(team_members_table, user_id)
-    except Exception as err:
-        return jsonify({"error": "Unable to load team memberships", "detail": str(err)}), 500
+    def delete_recording_page(page):
+        if not page:
+            return
+        object_keys = [item["objectKey"] for item in page if item.get("objectKey")]
+        row_keys = [
+            {"userId": user_id, "recordingId": item["recordingId"]}
+            for item in page
+            if item.get("recordingId")
+        ]
 
-    for membership in memberships:
-        team_id = membership.get("teamId")
-        if team_id:
-            team_members_table.delete_item(Key={"teamId": team_id, "userId": user_id})
+        if object_keys:
+            try:
+                # Resolved here so users without stored videos never need S3.
+                failed = delete_object_keys(get_s3_client(), object_keys)
+            except Exception as err:
+                logger.warning("POST /account/delete: S3 cleanup failed: %s", err)
+            else:
+                if failed:
+                    logger.warning(
+                        "POST /account/delete: S3 kept %d recording objects", len(failed)
+                    )
+        batch_delete_items(recordings_table, row_keys)
+
+    def delete_recordings():
+        if recordings_table is None:
+            return
+        # The next key page is fetched while this one is being deleted.
+        for page in iter_recording_key_pages(recordings_table, user_id):
+            delete_recording_page(page)
+
+    # The membership lookup doesn't depend on the recording purge, so its
+    # round-trip overlaps the purge instead of trailing it.
+    (_, recordings_err), (memberships, membership_err) = run_fanout(_capture, [
+        delete_recordings,
+        lambda: list_team_memberships(team_members_table, user_id),
+    ])
+    if recordings_err is not None:
+        detail = str(recordings_err)
+        return jsonify({"error": "Unable to delete recordings", "detail": detail}), 500
+    if membership_err is not None:
+        detail = str(membership_err)
+        return jsonify({"error": "Unable to load team memberships", "detail": detail}), 500
+
+    team_ids = {membership.get("teamId") for membership in memberships} - {None}
+    batch_delete_items(
+        team_members_table,
+        [{"teamId": team_id, "userId": user_id} for team_id in sorted(team_ids)],
+    )
+    for team_id in team_ids:
+        invalidate_team_members(team_id)
+    invalidate_team_membership(user_id)
 
     try:
         users_table.delete_item(Key={"userId": user_id})
@@ -2508,11 +2617,20 @@ def delete_account():
     return jsonify({"status": "ok"})
 
 
+def _compact_utc_timestamp() -> str:
+    """Format the current UTC time as YYYYMMDDTHHMMSSZ for S3 object keys."""
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}Z"
+    )
+
+
 @api_bp.route("/recordings/presign", methods=["POST"])
 def presign_recording_upload():
     data = request.get_json(silent=True) or {}
     user_id = _resolve_recording_user_id(data)
-    content_type = (data.get("contentType") or "video/webm").strip()
+    content_type = _clean_str(data, "contentType", "video/webm")
     duration_sec = data.get("durationSec")
     normalized_created_at, created_at_dt = _normalize_event_timestamp(data.get("createdAt"))
 
@@ -2552,8 +2670,8 @@ def presign_recording_upload():
     except RuntimeError as err:
         return jsonify({"error": str(err)}), 500
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    recording_id = uuid4().hex
+    timestamp = _compact_utc_timestamp()
+    recording_id = secrets.token_hex(16)
     extension = "webm" if "webm" in content_type else "bin"
     object_key = f"recordings/{user_id}/{timestamp}-{recording_id}.{extension}"
 
@@ -2581,10 +2699,10 @@ def presign_recording_upload():
 @api_bp.route("/recordings", methods=["POST"])
 def save_recording_metadata():
     data = request.get_json(silent=True) or {}
-    workout_id = (data.get("workoutId") or "").strip()
+    workout_id = _clean_str(data, "workoutId")
     user_id = _resolve_recording_user_id(data)
-    object_key = (data.get("objectKey") or "").strip()
-    content_type = (data.get("contentType") or "video/webm").strip()
+    object_key = _clean_str(data, "objectKey")
+    content_type = _clean_str(data, "contentType", "video/webm")
     duration_sec = data.get("durationSec")
     normalized_created_at, created_at_dt = _normalize_event_timestamp(data.get("createdAt"))
 
@@ -2617,7 +2735,7 @@ def save_recording_metadata():
         limit_payload["createdAt"] = normalized_created_at
         return jsonify(limit_payload), 400
 
-    recording_id = uuid4().hex
+    recording_id = secrets.token_hex(16)
     item = {
         "userId": user_id,
         "recordingId": recording_id,
@@ -2638,7 +2756,7 @@ def save_recording_metadata():
 
 @api_bp.route("/recordings/<user_id>", methods=["GET"])
 def list_recordings_for_user(user_id):
-    logger.info(f"GET /recordings/{user_id}")
+    logger.info("GET /recordings/%s", user_id)
 
     if not user_id:
         logger.warning("GET /recordings: user_id is required")
@@ -2658,11 +2776,11 @@ def list_recordings_for_user(user_id):
     try:
         recordings_table = get_recordings_table()
     except RuntimeError as err:
-        logger.error(f"GET /recordings: recordings table not available: {err}")
+        logger.error("GET /recordings: recordings table not available: %s", err)
         return jsonify({"error": str(err)}), 500
 
     try:
-        logger.debug(f"GET /recordings: querying recordings for user {user_id}")
+        logger.debug("GET /recordings: querying recordings for user %s", user_id)
         items, next_key = list_recordings_page(
             recordings_table,
             user_id=user_id,
@@ -2674,64 +2792,69 @@ def list_recordings_for_user(user_id):
         )
         logger.info("GET /recordings: found %d recordings for user %s", len(items), user_id)
     except Exception as err:
-        logger.error(f"GET /recordings: failed to load recordings: {err}", exc_info=True)
+        logger.error("GET /recordings: failed to load recordings: %s", err, exc_info=True)
         return jsonify({"error": "Unable to load recordings", "detail": str(err)}), 500
 
     try:
         logger.debug("GET /recordings: creating S3 client for presigned URLs")
         s3 = get_s3_client()
     except RuntimeError as err:
-        logger.error(f"GET /recordings: S3 client not available: {err}")
+        logger.error("GET /recordings: S3 client not available: %s", err)
         return jsonify({"error": str(err)}), 500
 
-    for item in items:
+    def playback_url(item):
         object_key = item.get("objectKey")
-        if object_key:
-            try:
-                logger.debug(f"GET /recordings: generating presigned URL for {object_key}")
-                item["playbackUrl"] = s3.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": UPLOAD_BUCKET_NAME, "Key": object_key},
-                    ExpiresIn=900,
-                )
-            except Exception as e:
-                logger.error(
-                    "GET /recordings: failed to generate presigned URL for %s: %s",
-                    object_key,
-                    e,
-                )
-                item["playbackUrl"] = None
-        else:
+        if not object_key:
             logger.warning("GET /recordings: recording missing objectKey")
-            item["playbackUrl"] = None
+            return None
+        try:
+            logger.debug("GET /recordings: generating presigned URL for %s", object_key)
+            return presign_playback_url(s3, object_key)
+        except Exception as e:
+            logger.error(
+                "GET /recordings: failed to generate presigned URL for %s: %s",
+                object_key,
+                e,
+            )
+            return None
+
+    # Presigning is local CPU work on the cached client (and usually a cache
+    # hit), so threads would only add overhead here.
+    for item in items:
+        item["playbackUrl"] = playback_url(item)
 
     logger.info("GET /recordings: returning %d recordings with playback URLs", len(items))
-    return jsonify({
+    response = jsonify({
         "userId": user_id,
         "recordings": items,
         "nextCursor": _encode_cursor(next_key),
     })
+    # Cached playback URLs keep the body stable between polls, so repeat
+    # requests can be answered with an empty 304.
+    response.add_etag()
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
 
 
 @api_bp.route("/workouts", methods=["POST"])
 def save_workout():
-    user_id = session.get("user_id")
-    logger.info(f"POST /workouts: user={user_id}")
+    user_id = current_user_id()
+    logger.info("POST /workouts: user=%s", user_id)
 
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     data = request.get_json(silent=True) or {}
     duration_sec = data.get("durationSec")
     workout_score = data.get("workoutScore")
-    summary = (data.get("summary") or "").strip()
-    alignment_details = (data.get("alignmentDetails") or "").strip()
+    summary = _clean_str(data, "summary")
+    alignment_details = _clean_str(data, "alignmentDetails")
     stroke_count = data.get("strokeCount")
     cadence_spm = data.get("cadenceSpm")
     range_of_motion = data.get("rangeOfMotion")
     arms_straight_score = data.get("armsStraightScore")
     back_straight_score = data.get("backStraightScore")
-    dominant_side = (data.get("dominantSide") or "").strip()
+    dominant_side = _clean_str(data, "dominantSide")
     started_at = data.get("startedAt")
     completed_at = data.get("completedAt") or now_iso()
     created_at = data.get("createdAt") or completed_at
@@ -2825,11 +2948,11 @@ def save_workout():
 
 @api_bp.route("/workouts", methods=["GET"])
 def list_workouts_for_current_user():
-    user_id = session.get("user_id")
-    logger.info(f"GET /workouts: user={user_id}")
+    user_id = current_user_id()
+    logger.info("GET /workouts: user=%s", user_id)
 
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     try:
         limit = _parse_limit(request.args.get("limit"), WORKOUTS_PAGE_SIZE)
@@ -2869,9 +2992,9 @@ def list_workouts_for_current_user():
 
 @api_bp.route("/workouts/<workout_id>", methods=["GET"])
 def get_workout_for_current_user(workout_id):
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     try:
         workouts_table = get_workouts_table()
@@ -2894,9 +3017,9 @@ def get_workout_for_current_user(workout_id):
 
 @api_bp.route("/workouts/alignment-preview", methods=["POST"])
 def preview_workout_alignment():
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     if not user_id:
-        return jsonify({"error": "authentication required"}), 401
+        return auth_required_response()
 
     data = request.get_json(silent=True) or {}
     frames = data.get("frames")
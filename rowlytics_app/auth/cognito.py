@@ -11,6 +11,8 @@ from urllib import request as urlrequest
 
 from flask import current_app
 
+from rowlytics_app.services.aws_config import AWS_CLIENT_CONFIG
+
 try:
     import boto3
 except ImportError:  # pragma: no cover - boto3 only needed when AWS is used
@@ -85,10 +87,22 @@ def exchange_code_for_tokens(code: str) -> dict:
         return json.loads(response.read().decode("utf-8"))
 
 
+_cognito_client = None
+
+
+def reset_client_cache() -> None:
+    """Drop the cached Cognito client (used by tests)."""
+    global _cognito_client
+    _cognito_client = None
+
+
 def _get_cognito_client():
+    global _cognito_client
     if boto3 is None:
         raise RuntimeError("boto3 is required for Cognito access")
-    return boto3.client("cognito-idp")
+    if _cognito_client is None:
+        _cognito_client = boto3.client("cognito-idp", config=AWS_CLIENT_CONFIG)
+    return _cognito_client
 
 
 def delete_cognito_user(user_id: str, email: str | None, access_token: str | None):
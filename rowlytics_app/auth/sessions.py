@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from flask import session
+from flask import g, session
+
+
+def current_user_id() -> str | None:
+    """Return the signed-in user id stashed on ``g`` by ``require_auth``."""
+    if "user_id" in g:
+        return g.user_id
+    return session.get("user_id")
 
 
 def user_context() -> dict[str, str | None]:
@@ -1,9 +1,75 @@
 import math
+import queue
+import threading
 
 import cv2
 import matplotlib.pyplot as plt
 import mediapipe as mp
 
+_POSE_LANDMARK = mp.solutions.pose.PoseLandmark
+_RIGHT_HIP = _POSE_LANDMARK.RIGHT_HIP.value
+_RIGHT_KNEE = _POSE_LANDMARK.RIGHT_KNEE.value
+# hip, knee, ankle, shoulder, elbow, thumb for each side of the body
+_RIGHT_SIDE = tuple(
+    _POSE_LANDMARK[f"RIGHT_{joint}"].value
+    for joint in ("HIP", "KNEE", "ANKLE", "SHOULDER", "ELBOW", "THUMB")
+)
+_LEFT_SIDE = tuple(
+    _POSE_LANDMARK[f"LEFT_{joint}"].value
+    for joint in ("HIP", "KNEE", "ANKLE", "SHOULDER", "ELBOW", "THUMB")
+)
+
+
+def _vertex_angle(vertex, end_a, end_b):
+    """Angle in radians at ``vertex`` between the segments to each end.
+
+    atan2(|cross|, dot) replaces the law-of-cosines acos: no square roots,
+    and no ValueError when rounding pushes the cosine just past +/-1.
+    """
+    ux, uy = end_a[0] - vertex[0], end_a[1] - vertex[1]
+    vx, vy = end_b[0] - vertex[0], end_b[1] - vertex[1]
+    return math.atan2(abs(ux * vy - uy * vx), ux * vx + uy * vy)
+
+
+def _threaded_frames(cap, *, keep_latest=False):
+    """Yield frames from ``cap`` while a background thread decodes ahead.
+
+    With ``keep_latest`` only the newest frame is held, which suits a live
+    camera; otherwise a few frames are buffered and none are dropped.
+    """
+    frames = queue.Queue(maxsize=1 if keep_latest else 4)
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            ret, frame = cap.read()
+            item = frame if ret else None
+            if keep_latest and item is not None:
+                try:
+                    frames.get_nowait()
+                except queue.Empty:
+                    pass
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if item is None:
+                return
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    try:
+        while True:
+            frame = frames.get()
+            if frame is None:
+                return
+            yield frame
+    finally:
+        stop.set()
+        reader.join()
+
 
 def cameraTest():
     # Zero input accesses webcam
@@ -60,22 +126,28 @@ def detectTest():
 def kinematicTest():
     mp_drawing = mp.solutions.drawing_utils
     mp_pose = mp.solutions.pose
+    # Lite model keeps the live preview responsive; modelTest stays on the
+    # default Full model since its angles are the reference stroke.
     pose = mp_pose.Pose(
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5,
+        model_complexity=0,
     )  # Pose estimator
 
     cap = cv2.VideoCapture(0)
+    # Decode on a background thread; stale webcam frames are dropped so the
+    # preview always runs inference on the newest one.
+    frames = _threaded_frames(cap, keep_latest=True)
 
     try:
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
+        for frame in frames:
             frame = cv2.resize(frame, (640, 480))
 
+            # Read-only input lets MediaPipe wrap the buffer instead of
+            # copying it; drawing below needs it writable again.
+            frame.flags.writeable = False
             results = pose.process(frame)
+            frame.flags.writeable = True
             mp_drawing.draw_landmarks(
                 frame,
                 results.pose_landmarks,
@@ -87,11 +159,14 @@ def kinematicTest():
             if cv2.waitKey(1) & 0xFF == ord("q"):
                 break
     finally:
+        frames.close()
         cap.release()
+        pose.close()  # frees the graph now rather than whenever GC runs
         cv2.destroyAllWindows()
 
 
-def modelTest():
+def modelTest(show=False):
+    """Extract stroke angles from the model clip; ``show`` previews frames."""
     mp_drawing = mp.solutions.drawing_utils
     mp_pose = mp.solutions.pose
     pose = mp_pose.Pose(
@@ -99,7 +174,20 @@ def modelTest():
         min_tracking_confidence=0.5,
     )  # Pose estimator
 
-    cap = cv2.VideoCapture(r"rowing_model_2.mp4")
+    # Ask FFmpeg for hardware decode where available (OpenCV >= 4.5.2).
+    # The property only applies at open time; unsupported devices simply
+    # decode in software.
+    hw_accel = getattr(cv2, "CAP_PROP_HW_ACCELERATION", None)
+    if hw_accel is not None:
+        cap = cv2.VideoCapture(
+            r"rowing_model_2.mp4",
+            cv2.CAP_FFMPEG,
+            [hw_accel, cv2.VIDEO_ACCELERATION_ANY],
+        )
+    else:
+        cap = cv2.VideoCapture(r"rowing_model_2.mp4", cv2.CAP_FFMPEG)
+    # Decode ahead of inference; every frame is kept, in order.
+    frames = _threaded_frames(cap)
     num_frames = 0
     nose_x = []
     nose_y = []
@@ -109,394 +197,67 @@ def modelTest():
     arm_angle = []
 
     try:
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
+        for frame in frames:
             num_frames += 1
             frame = cv2.resize(frame, (640, 480))
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Only ``frame`` is drawn on, so the RGB copy can stay read-only
+            # and MediaPipe skips its defensive copy.
+            frame_rgb.flags.writeable = False
             results = pose.process(frame_rgb)
 
             if results.pose_landmarks:
-                mp_drawing.draw_landmarks(
-                    frame,
-                    results.pose_landmarks,
-                    mp_pose.POSE_CONNECTIONS,
-                )  # Landmarks of pose estimator
-
-                if (
-                    results.pose_landmarks.landmark[
-                        mp_pose.PoseLandmark.RIGHT_KNEE
-                    ].x
-                    > results.pose_landmarks.landmark[
-                        mp_pose.PoseLandmark.RIGHT_HIP
-                    ].x
-                ):  # facing right
-
-                    nose_x.append(
-                        results.pose_landmarks.landmark[
-                            mp_pose.PoseLandmark.RIGHT_THUMB
-                        ].x
-                    )
-                    nose_y.append(
-                        1
-                        - results.pose_landmarks.landmark[
-                            mp_pose.PoseLandmark.RIGHT_THUMB
-                        ].y
-                    )
-                    thumb_pos.append(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_THUMB
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_THUMB
-                            ].y,
-                        )
-                    )
-
-                    angle = math.atan(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_HIP
-                            ].y
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_SHOULDER
-                            ].y
-                        )
-                        / (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_SHOULDER
-                            ].x
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_HIP
-                            ].x
-                        )
-                    )
-                    if angle < 0:
-                        angle += math.pi
-                    chest_angle.append(angle)
-
-                    knee_hip = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_HIP
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_HIP
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_KNEE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_KNEE
-                            ].y,
-                        ),
-                    )
-                    knee_ankle = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ANKLE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ANKLE
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_KNEE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_KNEE
-                            ].y,
-                        ),
-                    )
-                    hip_ankle = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_HIP
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_HIP
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ANKLE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ANKLE
-                            ].y,
-                        ),
-                    )
-                    knee_angle.append(
-                        math.acos(
-                            (knee_hip**2 + knee_ankle**2 - hip_ankle**2)
-                            / (2 * knee_hip * knee_ankle)
-                        )
+                if show:
+                    mp_drawing.draw_landmarks(
+                        frame,
+                        results.pose_landmarks,
+                        mp_pose.POSE_CONNECTIONS,
+                    )  # Landmarks of pose estimator
+
+                # Read each landmark off the protobuf once per frame.
+                landmarks = results.pose_landmarks.landmark
+                facing_right = (
+                    landmarks[_RIGHT_KNEE].x > landmarks[_RIGHT_HIP].x
+                )
+                hip, knee, ankle, shoulder, elbow, thumb = (
+                    landmarks[index]
+                    for index in (
+                        _RIGHT_SIDE if facing_right else _LEFT_SIDE
                     )
-
-                    thumb_elbow = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_THUMB
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_THUMB
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ELBOW
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ELBOW
-                            ].y,
-                        ),
-                    )
-                    elbow_shoulder = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ELBOW
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_ELBOW
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_SHOULDER
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_SHOULDER
-                            ].y,
-                        ),
-                    )
-                    thumb_shoulder = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_THUMB
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_THUMB
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_SHOULDER
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.RIGHT_SHOULDER
-                            ].y,
-                        ),
-                    )
-                    arm_angle.append(
-                        math.acos(
-                            (
-                                thumb_elbow**2
-                                + elbow_shoulder**2
-                                - thumb_shoulder**2
-                            )
-                            / (2 * thumb_elbow * elbow_shoulder)
-                        )
-                    )
-
-                else:  # facing left
-                    thumb_pos.append(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_THUMB
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_THUMB
-                            ].y,
-                        )
-                    )
-
-                    angle = math.atan(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_HIP
-                            ].y
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_SHOULDER
-                            ].y
-                        )
-                        / (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_SHOULDER
-                            ].x
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_HIP
-                            ].x
-                        )
-                    )
-                    if angle < 0:
-                        angle += math.pi
-                    chest_angle.append(angle)
-
-                    knee_hip = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_HIP
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_HIP
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_KNEE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_KNEE
-                            ].y,
-                        ),
-                    )
-                    knee_ankle = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ANKLE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ANKLE
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_KNEE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_KNEE
-                            ].y,
-                        ),
-                    )
-                    hip_ankle = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_HIP
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_HIP
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ANKLE
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ANKLE
-                            ].y,
-                        ),
-                    )
-                    knee_angle.append(
-                        math.acos(
-                            (knee_hip**2 + knee_ankle**2 - hip_ankle**2)
-                            / (2 * knee_hip * knee_ankle)
-                        )
-                    )
-
-                    thumb_elbow = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_THUMB
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_THUMB
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ELBOW
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ELBOW
-                            ].y,
-                        ),
-                    )
-                    elbow_shoulder = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ELBOW
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_ELBOW
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_SHOULDER
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_SHOULDER
-                            ].y,
-                        ),
-                    )
-                    thumb_shoulder = math.dist(
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_THUMB
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_THUMB
-                            ].y,
-                        ),
-                        (
-                            results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_SHOULDER
-                            ].x,
-                            1
-                            - results.pose_landmarks.landmark[
-                                mp_pose.PoseLandmark.LEFT_SHOULDER
-                            ].y,
-                        ),
-                    )
-                    arm_angle.append(
-                        math.acos(
-                            (
-                                thumb_elbow**2
-                                + elbow_shoulder**2
-                                - thumb_shoulder**2
-                            )
-                            / (2 * thumb_elbow * elbow_shoulder)
-                        )
-                    )
-
-            cv2.imshow("Output", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                break
+                )
+                hip_xy = (hip.x, 1 - hip.y)
+                knee_xy = (knee.x, 1 - knee.y)
+                ankle_xy = (ankle.x, 1 - ankle.y)
+                shoulder_xy = (shoulder.x, 1 - shoulder.y)
+                elbow_xy = (elbow.x, 1 - elbow.y)
+                thumb_xy = (thumb.x, 1 - thumb.y)
+
+                if facing_right:
+                    nose_x.append(thumb_xy[0])
+                    nose_y.append(thumb_xy[1])
+                thumb_pos.append(thumb_xy)
+
+                # atan2 folded into [0, pi) matches atan(dy / dx) but
+                # survives a vertical torso (dx == 0).
+                chest_angle.append(
+                    math.atan2(hip.y - shoulder.y, shoulder.x - hip.x)
+                    % math.pi
+                )
+
+                knee_angle.append(_vertex_angle(knee_xy, hip_xy, ankle_xy))
+                arm_angle.append(
+                    _vertex_angle(elbow_xy, thumb_xy, shoulder_xy)
+                )
+
+            if show:
+                cv2.imshow("Output", frame)
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    break
 
     finally:
+        frames.close()
         cap.release()
+        pose.close()
         cv2.destroyAllWindows()
         print(f"Total frames processed: {num_frames}")
         print(arm_angle)
@@ -0,0 +1,60 @@
+"""orjson-backed JSON provider for Flask."""
+
+from __future__ import annotations
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Encode responses with orjson while matching Flask's default output.
+
+    Keys stay sorted, ``Decimal`` values from DynamoDB and dates still go
+    through Flask's ``default`` hook, and anything orjson rejects (for
+    example integers wider than 64 bits) falls back to the stdlib encoder.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _encode(self, obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=self.default, option=self._options(indent))
+
+    def dumps(self, obj, **kwargs) -> str:
+        if set(kwargs) - {"separators", "indent"}:
+            return super().dumps(obj, **kwargs)
+        try:
+            return self._encode(obj, indent=bool(kwargs.get("indent"))).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        # Backs request.get_json(); orjson.JSONDecodeError subclasses ValueError,
+        # so ``silent=True`` keeps swallowing malformed bodies.
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = self._encode(obj, indent=indent) + b"\n"
+        except TypeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def install_json_provider(app) -> None:
+    """Use orjson for ``jsonify``/``tojson`` and request bodies when installed."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -8,6 +8,11 @@ import os
 import sys
 from logging import LogRecord
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 
 class JsonFormatter(logging.Formatter):
     """Format logs as JSON for better parsing in CloudWatch."""
@@ -30,6 +35,9 @@ class JsonFormatter(logging.Formatter):
         if record.exc_text:
             log_data["exc_text"] = record.exc_text
 
+        if orjson is not None:
+            # Every field is a str or int, which orjson always encodes.
+            return orjson.dumps(log_data).decode("utf-8")
         return json.dumps(log_data)
 
 
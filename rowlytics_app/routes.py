@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Iterable
 from urllib import parse
 from uuid import UUID
 
@@ -26,7 +25,7 @@ from rowlytics_app.auth.cognito import (
     decode_token_payload,
     exchange_code_for_tokens,
 )
-from rowlytics_app.auth.sessions import user_context
+from rowlytics_app.auth.sessions import current_user_id, user_context
 from rowlytics_app.services.dynamodb import fetch_user_profile, sync_user_profile
 from rowlytics_app.services.metrics import publish_login_latency
 from rowlytics_app.services.mock_email import send_mock_auto_email
@@ -109,12 +108,11 @@ TEMPLATE_CARDS: tuple[TemplateCard, ...] = (
 )
 
 
-def _iter_cards() -> Iterable[TemplateCard]:
-    return iter(TEMPLATE_CARDS)
+_CARDS_BY_SLUG: dict[str, TemplateCard] = {card.slug: card for card in TEMPLATE_CARDS}
 
 
 def _get_card(slug: str) -> TemplateCard | None:
-    return next((card for card in TEMPLATE_CARDS if card.slug == slug), None)
+    return _CARDS_BY_SLUG.get(slug)
 
 
 def _looks_generated_display_name(
@@ -182,7 +180,7 @@ def help_page() -> str:
 
 @public_bp.route("/settings")
 def settings() -> str:
-    user_id = session.get("user_id")
+    user_id = current_user_id()
     profile = fetch_user_profile(user_id)
 
     is_coach = False
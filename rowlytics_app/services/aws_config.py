@@ -0,0 +1,28 @@
+"""Shared botocore configuration for every AWS client: DynamoDB, S3, Cognito, SES, CloudWatch."""
+
+from __future__ import annotations
+
+from rowlytics_app.services.fanout import AWS_FANOUT_WORKERS
+
+try:
+    from botocore.config import Config
+except ImportError:  # pragma: no cover - boto3 only needed when AWS is used
+    Config = None
+
+
+def _build_client_config():
+    if Config is None:
+        return None
+    return Config(
+        # Leave headroom over the fan-out width so overlapped calls never
+        # wait on urllib3 for a pooled connection.
+        max_pool_connections=max(10, AWS_FANOUT_WORKERS * 2),
+        retries={"mode": "standard", "max_attempts": 3},
+        tcp_keepalive=True,
+        # Fail fast on a dead endpoint so the retry gets a fresh connection
+        # instead of the request idling for botocore's 60 second default.
+        connect_timeout=2,
+    )
+
+
+AWS_CLIENT_CONFIG = _build_client_config()
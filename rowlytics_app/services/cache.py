@@ -0,0 +1,74 @@
+"""Small in-process caches for read-mostly DynamoDB lookups."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+
+_MISSING = object()
+_instances: weakref.WeakSet = weakref.WeakSet()
+
+
+def env_ttl(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return default
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being set.
+
+    A ``ttl`` of zero disables caching, which keeps multi-instance deployments
+    strictly consistent when that matters more than the saved round-trip.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+        _instances.add(self)
+
+    def get(self, key, default=None):
+        if self.ttl <= 0:
+            return default
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key, value) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Entries are inserted in expiry order, so the oldest goes first.
+                self._entries.pop(next(iter(self._entries)))
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def clear_all_caches() -> None:
+    """Empty every TTLCache in the process (used by tests)."""
+    for cache in list(_instances):
+        cache.clear()
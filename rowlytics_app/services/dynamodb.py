@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
 from rowlytics_app.models.users import canonicalize_display_name, normalize_display_name
+from rowlytics_app.services.aws_config import AWS_CLIENT_CONFIG
+from rowlytics_app.services.cache import TTLCache, env_ttl
+from rowlytics_app.services.fanout import run_fanout
 
 try:
     import boto3
@@ -26,6 +31,7 @@ TEAMS_TABLE_NAME = os.getenv("ROWLYTICS_TEAMS_TABLE", "RowlyticsTeams")
 TEAM_MEMBERS_TABLE_NAME = os.getenv("ROWLYTICS_TEAM_MEMBERS_TABLE", "RowlyticsTeamMembers")
 TEAM_MEMBERS_USER_INDEX = os.getenv("ROWLYTICS_TEAM_MEMBERS_USER_INDEX", "UserIdIndex")
 TEAM_NAME_INDEX = os.getenv("ROWLYTICS_TEAMS_NAME_INDEX", "TeamNameIndex")
+TEAMS_COACH_INDEX = os.getenv("ROWLYTICS_TEAMS_COACH_INDEX", "CoachUserIdIndex")
 RECORDINGS_TABLE_NAME = os.getenv("ROWLYTICS_RECORDINGS_TABLE", "RowlyticsRecordings")
 WORKOUTS_TABLE_NAME = os.getenv("ROWLYTICS_WORKOUTS_TABLE", "RowlyticsWorkouts")
 RECORDINGS_CREATED_AT_INDEX = os.getenv(
@@ -36,6 +42,32 @@ WORKOUTS_COMPLETED_AT_INDEX = os.getenv(
     "ROWLYTICS_WORKOUTS_COMPLETED_AT_INDEX",
     "UserCompletedAtIndex",
 )
+BATCH_GET_MAX_ATTEMPTS = 5
+# Covers any UTC offset (at most +/-14h) in stored completedAt strings.
+COMPLETED_AT_KEY_SLACK = timedelta(days=1)
+BATCH_GET_BACKOFF_SECONDS = 0.05
+MEMBERSHIP_PROJECTION = "teamId, userId, memberRole, joinedAt"
+# Only the profile fields the roster views read; ``name`` is a reserved word.
+USER_SUMMARY_PROJECTION = (
+    "userId, #name, email, emailUpdateFrequency, emailUpdateIntervalValue, "
+    "emailUpdateIntervalUnit, emailUpdateIntervalUpdatedAt, lastCoachSummarySentAt"
+)
+USER_SUMMARY_ATTRIBUTE_NAMES = {"#name": "name"}
+NEW_MEMBERSHIP_CONDITION = "attribute_not_exists(teamId) AND attribute_not_exists(userId)"
+SYNC_PROFILE_UPDATE = (
+    "SET #name = if_not_exists(#name, :name), "
+    "nameKey = if_not_exists(nameKey, :nameKey), "
+    "createdAt = if_not_exists(createdAt, :createdAt)"
+)
+SYNC_PROFILE_UPDATE_WITH_EMAIL = SYNC_PROFILE_UPDATE + ", email = if_not_exists(email, :email)"
+SYNC_PROFILE_ATTRIBUTE_NAMES = {"#name": "name"}
+TEAM_MEMBERS_CACHE_TTL_SECONDS = env_ttl("ROWLYTICS_TEAM_MEMBERS_CACHE_TTL", 30.0)
+MEMBERSHIP_CACHE_TTL_SECONDS = env_ttl("ROWLYTICS_MEMBERSHIP_CACHE_TTL", 60.0)
+TEAMS_CACHE_TTL_SECONDS = env_ttl("ROWLYTICS_TEAMS_CACHE_TTL", 300.0)
+
+_team_members_cache = TTLCache(TEAM_MEMBERS_CACHE_TTL_SECONDS)
+_membership_cache = TTLCache(MEMBERSHIP_CACHE_TTL_SECONDS)
+_teams_cache = TTLCache(TEAMS_CACHE_TTL_SECONDS)
 
 
 def now_iso() -> str:
@@ -73,42 +105,63 @@ def _coerce_duration_seconds(value) -> int:
     return int(round(duration))
 
 
+_resource = None
+_tables: dict = {}
+
+
+def reset_client_cache() -> None:
+    """Drop the cached DynamoDB resource and tables (used by tests)."""
+    global _resource
+    _resource = None
+    _tables.clear()
+
+
 def _get_resource():
+    global _resource
     if boto3 is None:
         raise RuntimeError("boto3 is required for DynamoDB access")
-    logger.debug("Creating DynamoDB resource")
-    return boto3.resource("dynamodb")
+    if _resource is None:
+        logger.debug("Creating DynamoDB resource")
+        _resource = boto3.resource("dynamodb", config=AWS_CLIENT_CONFIG)
+    return _resource
+
+
+def _get_table(table_name: str):
+    table = _tables.get(table_name)
+    if table is None:
+        table = _tables[table_name] = _get_resource().Table(table_name)
+    return table
 
 
 def get_users_table():
-    logger.debug(f"Accessing users table: {USERS_TABLE_NAME}")
-    return _get_resource().Table(USERS_TABLE_NAME)
+    logger.debug("Accessing users table: %s", USERS_TABLE_NAME)
+    return _get_table(USERS_TABLE_NAME)
 
 
 def get_team_members_table():
-    logger.debug(f"Accessing team members table: {TEAM_MEMBERS_TABLE_NAME}")
-    return _get_resource().Table(TEAM_MEMBERS_TABLE_NAME)
+    logger.debug("Accessing team members table: %s", TEAM_MEMBERS_TABLE_NAME)
+    return _get_table(TEAM_MEMBERS_TABLE_NAME)
 
 
 def get_teams_table():
-    logger.debug(f"Accessing teams table: {TEAMS_TABLE_NAME}")
-    return _get_resource().Table(TEAMS_TABLE_NAME)
+    logger.debug("Accessing teams table: %s", TEAMS_TABLE_NAME)
+    return _get_table(TEAMS_TABLE_NAME)
 
 
 def get_recordings_table():
     if not RECORDINGS_TABLE_NAME:
         logger.error("ROWLYTICS_RECORDINGS_TABLE environment variable is not configured")
         raise RuntimeError("ROWLYTICS_RECORDINGS_TABLE is not configured")
-    logger.debug(f"Accessing recordings table: {RECORDINGS_TABLE_NAME}")
-    return _get_resource().Table(RECORDINGS_TABLE_NAME)
+    logger.debug("Accessing recordings table: %s", RECORDINGS_TABLE_NAME)
+    return _get_table(RECORDINGS_TABLE_NAME)
 
 
 def get_workouts_table():
     if not WORKOUTS_TABLE_NAME:
         logger.error("ROWLYTICS_WORKOUTS_TABLE environment variable is not configured")
         raise RuntimeError("ROWLYTICS_WORKOUTS_TABLE is not configured")
-    logger.debug(f"Accessing workouts table: {WORKOUTS_TABLE_NAME}")
-    return _get_resource().Table(WORKOUTS_TABLE_NAME)
+    logger.debug("Accessing workouts table: %s", WORKOUTS_TABLE_NAME)
+    return _get_table(WORKOUTS_TABLE_NAME)
 
 
 def get_workout_for_user(workouts_table, user_id: str, workout_id: str):
@@ -144,12 +197,7 @@ def sync_user_profile(user_id: str | None, email: str | None, name: str | None)
     name_key = normalize_display_name(safe_name)
     now = now_iso()
 
-    update_expr = (
-        "SET #name = if_not_exists(#name, :name), "
-        "nameKey = if_not_exists(nameKey, :nameKey), "
-        "createdAt = if_not_exists(createdAt, :createdAt)"
-    )
-    expr_attr_names = {"#name": "name"}
+    update_expr = SYNC_PROFILE_UPDATE
     expr_attr_values = {
         ":name": safe_name,
         ":nameKey": name_key,
@@ -157,7 +205,7 @@ def sync_user_profile(user_id: str | None, email: str | None, name: str | None)
     }
 
     if email:
-        update_expr += ", email = if_not_exists(email, :email)"
+        update_expr = SYNC_PROFILE_UPDATE_WITH_EMAIL
         expr_attr_values[":email"] = email
 
     try:
@@ -170,11 +218,11 @@ def sync_user_profile(user_id: str | None, email: str | None, name: str | None)
         response = table.update_item(
             Key={"userId": user_id},
             UpdateExpression=update_expr,
-            ExpressionAttributeNames=expr_attr_names,
+            ExpressionAttributeNames=SYNC_PROFILE_ATTRIBUTE_NAMES,
             ExpressionAttributeValues=expr_attr_values,
             ReturnValues="ALL_NEW",
         )
-        logger.info(f"sync_user_profile: successfully updated user {user_id}")
+        logger.info("sync_user_profile: successfully updated user %s", user_id)
     except Exception as e:
         logger.error(
             "sync_user_profile: failed to update user %s: %s",
@@ -193,24 +241,30 @@ def batch_get_users(users_table, user_ids):
         logger.debug("batch_get_users: no user_ids provided")
         return {}
     client = users_table.meta.client
-    users_by_id = {}
-    logger.debug(f"batch_get_users: fetching {len(user_ids)} users")
-    for idx in range(0, len(user_ids), 100):
-        chunk = user_ids[idx:idx + 100]
+    # BatchGetItem rejects duplicate keys, and rosters can list a user twice.
+    user_ids = list(dict.fromkeys(user_ids))
+    logger.debug("batch_get_users: fetching %s users", len(user_ids))
+
+    def fetch_chunk(chunk):
+        users = []
+        request_items = {
+            users_table.name: {
+                "Keys": [{"userId": user_id} for user_id in chunk],
+                "ProjectionExpression": USER_SUMMARY_PROJECTION,
+                "ExpressionAttributeNames": USER_SUMMARY_ATTRIBUTE_NAMES,
+            }
+        }
         try:
-            response = client.batch_get_item(
-                RequestItems={
-                    users_table.name: {
-                        "Keys": [{"userId": user_id} for user_id in chunk]
-                    }
-                }
-            )
-            users = response.get("Responses", {}).get(users_table.name, [])
-            logger.debug(f"batch_get_users: retrieved {len(users)} users in batch")
-            for user in users:
-                user_id = user.get("userId")
-                if user_id:
-                    users_by_id[user_id] = user
+            for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+                if attempt:
+                    time.sleep(BATCH_GET_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                response = client.batch_get_item(RequestItems=request_items)
+                batch = response.get("Responses", {}).get(users_table.name, [])
+                logger.debug("batch_get_users: retrieved %s users in batch", len(batch))
+                users.extend(batch)
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    break
         except Exception as e:
             logger.error(
                 "batch_get_users: failed to fetch batch of %d users: %s",
@@ -219,18 +273,103 @@ def batch_get_users(users_table, user_ids):
                 exc_info=True,
             )
             raise
-    logger.info(f"batch_get_users: successfully fetched {len(users_by_id)} total users")
+        if request_items:
+            logger.warning(
+                "batch_get_users: giving up on %d unprocessed keys after %d attempts",
+                len(request_items.get(users_table.name, {}).get("Keys", [])),
+                BATCH_GET_MAX_ATTEMPTS,
+            )
+        return users
+
+    # Chunks are independent BatchGetItem calls, so large rosters overlap them.
+    chunks = [user_ids[idx:idx + 100] for idx in range(0, len(user_ids), 100)]
+    users_by_id = {}
+    for users in run_fanout(fetch_chunk, chunks):
+        for user in users:
+            user_id = user.get("userId")
+            if user_id:
+                users_by_id[user_id] = user
+    logger.info("batch_get_users: successfully fetched %s total users", len(users_by_id))
     return users_by_id
 
 
-def fetch_team_members(users_table, team_members_table, team_id: str, allowed_roles: set[str]):
-    logger.debug(f"fetch_team_members: querying team {team_id}")
+def invalidate_team_members(team_id: str | None) -> None:
+    """Forget the cached roster for a team after its membership changes."""
+    if team_id:
+        _team_members_cache.pop(team_id)
+
+
+def invalidate_team_membership(user_id: str | None) -> None:
+    """Forget the cached membership lookup for a user who joined or left a team."""
+    if user_id:
+        _membership_cache.pop(user_id)
+
+
+def invalidate_user_team_roster(team_members_table, user_id: str | None) -> None:
+    """Forget the cached roster of the user's team after their profile changes.
+
+    Rosters embed users-table fields (name, email, summary settings), so a
+    profile write would otherwise stay invisible until the roster expires.
+    """
+    if not user_id:
+        return
     try:
-        response = team_members_table.query(
-            KeyConditionExpression=Key("teamId").eq(team_id)
+        membership = get_team_membership(team_members_table, user_id)
+    except Exception as err:
+        logger.warning(
+            "invalidate_user_team_roster: membership lookup failed for %s, "
+            "dropping all cached rosters: %s",
+            user_id,
+            err,
         )
-        items = response.get("Items", [])
-        logger.info(f"fetch_team_members: found {len(items)} team members for team {team_id}")
+        _team_members_cache.clear()
+        return
+    if membership:
+        invalidate_team_members(membership.get("teamId"))
+
+
+def invalidate_team(team_id: str | None) -> None:
+    """Forget cached team metadata and roster after a team is deleted."""
+    if team_id:
+        _teams_cache.pop(team_id)
+        _team_members_cache.pop(team_id)
+
+
+def _normalize_member_role(raw_role, allowed_roles) -> str:
+    role = raw_role.lower() if isinstance(raw_role, str) else "rower"
+    if role not in allowed_roles:
+        role = "coach" if "coach" in role else "rower"
+    return role
+
+
+def fetch_team_members(
+    users_table,
+    team_members_table,
+    team_id: str,
+    allowed_roles: set[str],
+    *,
+    use_cache: bool = True,
+):
+    """Return the team's members merged with their user profiles.
+
+    Pass ``use_cache=False`` when a decision depends on the profile fields
+    (e.g. whether a coach summary is due), so a cached roster cannot hide a
+    recent settings change.
+    """
+    roles_key = frozenset(allowed_roles)
+    cached = _team_members_cache.get(team_id) if use_cache else None
+    if cached is not None and cached[0] == roles_key:
+        logger.debug("fetch_team_members: cache hit for team %s", team_id)
+        return list(cached[1])
+
+    logger.debug("fetch_team_members: querying team %s", team_id)
+    try:
+        items = query_all(
+            team_members_table,
+            KeyConditionExpression=Key("teamId").eq(team_id),
+            ProjectionExpression=MEMBERSHIP_PROJECTION,
+        )
+        logger.info("fetch_team_members: found %s team members for team %s", len(items), team_id)
     except Exception as e:
         logger.error(
             "fetch_team_members: failed to query team members for team %s: %s",
@@ -240,6 +379,10 @@ def fetch_team_members(users_table, team_members_table, team_id: str, allowed_ro
         )
         raise
 
+    if not items:
+        _team_members_cache.set(team_id, (roles_key, []))
+        return []
+
     user_ids = [item.get("userId") for item in items if item.get("userId")]
     users_by_id = batch_get_users(users_table, user_ids)
 
@@ -247,11 +390,7 @@ def fetch_team_members(users_table, team_members_table, team_id: str, allowed_ro
     for item in items:
         user_id = item.get("userId")
         user = users_by_id.get(user_id, {})
-        raw_role = item.get("memberRole")
-        role = raw_role.lower() if isinstance(raw_role, str) else "rower"
-        if role not in allowed_roles:
-            role = "coach" if "coach" in role else "rower"
-
+        role = _normalize_member_role(item.get("memberRole"), allowed_roles)
         members.append({
             "userId": user_id,
             "memberRole": role,
@@ -264,53 +403,148 @@ def fetch_team_members(users_table, team_members_table, team_id: str, allowed_ro
             "lastCoachSummarySentAt": user.get("lastCoachSummarySentAt"),
         })
 
-    logger.debug(f"fetch_team_members: successfully built member list with {len(members)} members")
-    return members
+    logger.debug("fetch_team_members: successfully built member list with %s members", len(members))
+    _team_members_cache.set(team_id, (roles_key, members))
+    return list(members)
+
+
+def _raise_for_missing_index(caller: str, index_name: str, table_name: str, err) -> None:
+    """Turn a missing-GSI error into a RuntimeError that names the index.
+
+    These lookups are only ever served by their GSI; falling back to a full
+    table scan on every request is not an acceptable degradation.
+    """
+    if ClientError and isinstance(err, ClientError):
+        error_code = err.response.get("Error", {}).get("Code")
+        if error_code in {"ValidationException", "ResourceNotFoundException"}:
+            logger.error("%s: %s index is unavailable: %s", caller, index_name, err)
+            raise RuntimeError(f"{index_name} GSI is required on {table_name}") from err
+
+
+def transaction_cancellation_codes(err) -> list[str | None]:
+    """Return the per-item cancellation codes from a TransactionCanceledException."""
+    if not (ClientError and isinstance(err, ClientError)):
+        return []
+    if err.response.get("Error", {}).get("Code") != "TransactionCanceledException":
+        return []
+    return [reason.get("Code") for reason in err.response.get("CancellationReasons") or []]
+
+
+def put_team_membership(teams_table, team_members_table, item: dict) -> None:
+    """Insert a membership row in one transaction that also asserts the team exists.
+
+    A ConditionCheck on the team row replaces a separate read, and the put is
+    conditioned on the membership not existing yet. On failure the
+    TransactionCanceledException is raised unchanged; use
+    ``transaction_cancellation_codes`` to tell a missing team (index 0) from an
+    existing membership (index 1).
+    """
+    team_members_table.meta.client.transact_write_items(
+        TransactItems=[
+            {
+                "ConditionCheck": {
+                    "TableName": teams_table.name,
+                    "Key": {"teamId": item["teamId"]},
+                    "ConditionExpression": "attribute_exists(teamId)",
+                }
+            },
+            {
+                "Put": {
+                    "TableName": team_members_table.name,
+                    "Item": item,
+                    "ConditionExpression": NEW_MEMBERSHIP_CONDITION,
+                }
+            },
+        ]
+    )
+
+
+def put_team_with_owner(teams_table, team_members_table, team_item: dict, member_item: dict):
+    """Create a team and its coach membership row in one transaction.
+
+    Neither row is written unless both conditions hold, so a failure can no
+    longer leave a team without an owner. Cancellation index 0 is the team
+    put and index 1 the membership put.
+    """
+    team_members_table.meta.client.transact_write_items(
+        TransactItems=[
+            {
+                "Put": {
+                    "TableName": teams_table.name,
+                    "Item": team_item,
+                    "ConditionExpression": "attribute_not_exists(teamId)",
+                }
+            },
+            {
+                "Put": {
+                    "TableName": team_members_table.name,
+                    "Item": member_item,
+                    "ConditionExpression": NEW_MEMBERSHIP_CONDITION,
+                }
+            },
+        ]
+    )
+
+
+def get_team_membership(team_members_table, user_id: str, *, use_cache: bool = True):
+    """Return the user's membership row, or None when they are not on a team.
 
+    Pass ``use_cache=False`` when the result guards a write, so a lookup cached
+    by another request cannot hide a membership created elsewhere.
+    """
+    if use_cache:
+        # Entries are wrapped in a tuple so "not on a team" is cached too.
+        cached = _membership_cache.get(user_id)
+        if cached is not None:
+            logger.debug("get_team_membership: cache hit for user %s", user_id)
+            return cached[0]
+    membership = _query_team_membership(team_members_table, user_id)
+    _membership_cache.set(user_id, (membership,))
+    return membership
 
-def get_team_membership(team_members_table, user_id: str):
-    logger.debug(f"get_team_membership: querying membership for user {user_id}")
+
+def _query_team_membership(team_members_table, user_id: str):
+    logger.debug("get_team_membership: querying membership for user %s", user_id)
     try:
+        # A user belongs to at most one team, so one GSI item is enough.
         response = team_members_table.query(
             IndexName=TEAM_MEMBERS_USER_INDEX,
             KeyConditionExpression=Key("userId").eq(user_id),
+            ProjectionExpression=MEMBERSHIP_PROJECTION,
+            Limit=1,
         )
         items = response.get("Items", [])
         if items:
-            logger.info(f"get_team_membership: found membership for user {user_id}")
+            logger.info("get_team_membership: found membership for user %s", user_id)
             return items[0]
         else:
-            logger.info(f"get_team_membership: no membership found for user {user_id}")
+            logger.info("get_team_membership: no membership found for user %s", user_id)
             return None
     except Exception as err:
-        logger.warning(f"get_team_membership: query failed, attempting fallback scan: {err}")
-        if ClientError and isinstance(err, ClientError):
-            error_code = err.response.get("Error", {}).get("Code")
-            if error_code in {"ValidationException", "ResourceNotFoundException"}:
-                if Attr is None:
-                    raise
-                logger.debug(f"get_team_membership: using scan fallback for user {user_id}")
-                response = team_members_table.scan(
-                    FilterExpression=Attr("userId").eq(user_id),
-                    Limit=1,
-                )
-                items = response.get("Items", [])
-                return items[0] if items else None
+        _raise_for_missing_index(
+            "get_team_membership", TEAM_MEMBERS_USER_INDEX, TEAM_MEMBERS_TABLE_NAME, err
+        )
         raise
 
 
 def get_team(teams_table, team_id: str):
-    logger.debug(f"get_team: fetching team {team_id}")
+    cached = _teams_cache.get(team_id)
+    if cached is not None:
+        logger.debug("get_team: cache hit for team %s", team_id)
+        return cached
+    logger.debug("get_team: fetching team %s", team_id)
     try:
         response = teams_table.get_item(Key={"teamId": team_id})
         item = response.get("Item")
         if item:
-            logger.info(f"get_team: successfully retrieved team {team_id}")
+            logger.info("get_team: successfully retrieved team %s", team_id)
+            # Teams are not edited after create, so only deletion invalidates.
+            _teams_cache.set(team_id, item)
         else:
-            logger.warning(f"get_team: team {team_id} not found")
+            logger.warning("get_team: team %s not found", team_id)
         return item
     except Exception as e:
-        logger.error(f"get_team: failed to fetch team {team_id}: {e}", exc_info=True)
+        logger.error("get_team: failed to fetch team %s: %s", team_id, e, exc_info=True)
         raise
 
 
@@ -326,17 +560,36 @@ def query_all(table, **kwargs):
             batch_items = response.get("Items", [])
             items.extend(batch_items)
             batch_count += 1
-            logger.debug(f"query_all: fetched {len(batch_items)} items in batch {batch_count}")
+            logger.debug("query_all: fetched %s items in batch %s", len(batch_items), batch_count)
             last_key = response.get("LastEvaluatedKey")
             if not last_key:
                 break
         except Exception as e:
-            logger.error(f"query_all: failed during batch {batch_count}: {e}", exc_info=True)
+            logger.error("query_all: failed during batch %s: %s", batch_count, e, exc_info=True)
             raise
-    logger.info(f"query_all: retrieved {len(items)} total items across {batch_count} batches")
+    logger.info("query_all: retrieved %s total items across %s batches", len(items), batch_count)
     return items
 
 
+def iter_query_pages_prefetch(table, **kwargs):
+    """Yield each page of query results, requesting page N+1 while N is in use.
+
+    Only worth it when the caller does its own I/O per page (e.g. batch
+    deletes), since that work then overlaps the next query's round-trip.
+    """
+    query_kwargs = dict(kwargs)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(table.query, **query_kwargs)
+        while pending is not None:
+            response = pending.result()
+            last_key = response.get("LastEvaluatedKey")
+            pending = None
+            if last_key:
+                query_kwargs["ExclusiveStartKey"] = last_key
+                pending = executor.submit(table.query, **dict(query_kwargs))
+            yield response.get("Items", [])
+
+
 def query_page(table, *, limit: int, exclusive_start_key=None, **kwargs):
     query_kwargs = dict(kwargs)
     query_kwargs["Limit"] = limit
@@ -358,19 +611,19 @@ def scan_all(table, **kwargs):
             batch_items = response.get("Items", [])
             items.extend(batch_items)
             batch_count += 1
-            logger.debug(f"scan_all: fetched {len(batch_items)} items in batch {batch_count}")
+            logger.debug("scan_all: fetched %s items in batch %s", len(batch_items), batch_count)
             last_key = response.get("LastEvaluatedKey")
             if not last_key:
                 break
         except Exception as e:
-            logger.error(f"scan_all: failed during batch {batch_count}: {e}", exc_info=True)
+            logger.error("scan_all: failed during batch %s: %s", batch_count, e, exc_info=True)
             raise
-    logger.info(f"scan_all: retrieved {len(items)} total items across {batch_count} batches")
+    logger.info("scan_all: retrieved %s total items across %s batches", len(items), batch_count)
     return items
 
 
 def list_team_memberships(team_members_table, user_id: str):
-    logger.debug(f"list_team_memberships: querying memberships for user {user_id}")
+    logger.debug("list_team_memberships: querying memberships for user %s", user_id)
     try:
         items = query_all(
             team_members_table,
@@ -384,17 +637,9 @@ def list_team_memberships(team_members_table, user_id: str):
         )
         return items
     except Exception as err:
-        logger.warning(f"list_team_memberships: query failed, attempting fallback scan: {err}")
-        if ClientError and isinstance(err, ClientError):
-            error_code = err.response.get("Error", {}).get("Code")
-            if error_code in {"ValidationException", "ResourceNotFoundException"}:
-                if Attr is None:
-                    raise
-                logger.debug(f"list_team_memberships: using scan fallback for user {user_id}")
-                return scan_all(
-                    team_members_table,
-                    FilterExpression=Attr("userId").eq(user_id),
-                )
+        _raise_for_missing_index(
+            "list_team_memberships", TEAM_MEMBERS_USER_INDEX, TEAM_MEMBERS_TABLE_NAME, err
+        )
         raise
 
 
@@ -402,16 +647,32 @@ def list_team_members_by_team(team_members_table, team_id: str):
     return query_all(
         team_members_table,
         KeyConditionExpression=Key("teamId").eq(team_id),
+        ProjectionExpression=MEMBERSHIP_PROJECTION,
     )
 
 
 def list_owned_teams(teams_table, user_id: str):
     if Attr is None:
         return []
-    return scan_all(
-        teams_table,
-        FilterExpression=Attr("coachUserId").eq(user_id),
-    )
+    try:
+        return query_all(
+            teams_table,
+            IndexName=TEAMS_COACH_INDEX,
+            KeyConditionExpression=Key("coachUserId").eq(user_id),
+        )
+    except Exception as err:
+        logger.warning("list_owned_teams: index query failed, using fallback scan: %s", err)
+        if ClientError and isinstance(err, ClientError):
+            error_code = err.response.get("Error", {}).get("Code")
+            if error_code not in {"ValidationException", "ResourceNotFoundException"}:
+                raise
+        else:
+            raise
+
+        return scan_all(
+            teams_table,
+            FilterExpression=Attr("coachUserId").eq(user_id),
+        )
 
 
 def list_recordings(recordings_table, user_id: str):
@@ -438,6 +699,27 @@ def list_recordings(recordings_table, user_id: str):
         return sorted(items, key=lambda item: item.get("createdAt") or "", reverse=True)
 
 
+def batch_delete_items(table, keys) -> None:
+    """Delete rows by primary key; boto3 groups them into 25-item BatchWriteItem calls."""
+    with table.batch_writer() as batch:
+        for key in keys:
+            batch.delete_item(Key=key)
+
+
+def iter_recording_key_pages(recordings_table, user_id: str):
+    """Yield pages of a user's recording keys and S3 object keys, unsorted.
+
+    Reads the base table directly, so callers that only need to act on every
+    recording (e.g. account deletion) skip the index and its sort order. The
+    next page is fetched while the caller works through the current one.
+    """
+    return iter_query_pages_prefetch(
+        recordings_table,
+        KeyConditionExpression=Key("userId").eq(user_id),
+        ProjectionExpression="recordingId, objectKey",
+    )
+
+
 def list_recordings_page(
     recordings_table,
     user_id: str,
@@ -515,12 +797,34 @@ def sum_recording_durations_for_utc_date(
     return total_duration_sec
 
 
-def list_workouts(workouts_table, user_id: str):
+def list_workouts(
+    workouts_table,
+    user_id: str,
+    completed_from: datetime | None = None,
+    completed_to: datetime | None = None,
+):
+    """Return a user's workouts, newest first.
+
+    ``completed_from``/``completed_to`` only narrow the index read, so
+    windowed callers (weekly stats, coach summaries) skip older history.
+    completedAt is stored as the client sent it (``Z``, ``+00:00`` or another
+    offset), so the string bounds are widened by ``COMPLETED_AT_KEY_SLACK``
+    and callers must still make the exact cut on parsed timestamps.
+    """
+    key_condition = Key("userId").eq(user_id)
+    if completed_from is not None:
+        lower = (completed_from - COMPLETED_AT_KEY_SLACK).isoformat()
+        if completed_to is not None:
+            upper = (completed_to + COMPLETED_AT_KEY_SLACK).isoformat()
+            key_condition = key_condition & Key("completedAt").between(lower, upper)
+        else:
+            key_condition = key_condition & Key("completedAt").gte(lower)
+
     try:
         return query_all(
             workouts_table,
             IndexName=WORKOUTS_COMPLETED_AT_INDEX,
-            KeyConditionExpression=Key("userId").eq(user_id),
+            KeyConditionExpression=key_condition,
             ScanIndexForward=False,
         )
     except Exception as err:
@@ -565,6 +869,18 @@ def list_workouts_page(
     )
 
 
+def build_page_member(item: dict, user: dict, allowed_roles) -> dict:
+    """Shape a membership row and its user profile as a roster page entry."""
+    return {
+        "userId": item.get("userId"),
+        "memberRole": _normalize_member_role(item.get("memberRole"), allowed_roles),
+        "joinedAt": item.get("joinedAt"),
+        "name": user.get("name"),
+        "email": user.get("email"),
+        "emailUpdateFrequency": user.get("emailUpdateFrequency", "weekly"),
+    }
+
+
 def fetch_team_members_page(
     users_table,
     team_members_table,
@@ -575,6 +891,7 @@ def fetch_team_members_page(
 ):
     query_kwargs = {
         "KeyConditionExpression": Key("teamId").eq(team_id),
+        "ProjectionExpression": MEMBERSHIP_PROJECTION,
         "Limit": limit,
     }
     if exclusive_start_key:
@@ -584,26 +901,16 @@ def fetch_team_members_page(
         **query_kwargs,
     )
     items = response.get("Items", [])
+    if not items:
+        return [], response.get("LastEvaluatedKey")
+
     user_ids = [item.get("userId") for item in items if item.get("userId")]
     users_by_id = batch_get_users(users_table, user_ids)
 
-    members = []
-    for item in items:
-        user_id = item.get("userId")
-        user = users_by_id.get(user_id, {})
-        raw_role = item.get("memberRole")
-        role = raw_role.lower() if isinstance(raw_role, str) else "rower"
-        if role not in allowed_roles:
-            role = "coach" if "coach" in role else "rower"
-
-        members.append({
-            "userId": user_id,
-            "memberRole": role,
-            "joinedAt": item.get("joinedAt"),
-            "name": user.get("name"),
-            "email": user.get("email"),
-            "emailUpdateFrequency": user.get("emailUpdateFrequency", "weekly"),
-        })
+    members = [
+        build_page_member(item, users_by_id.get(item.get("userId"), {}), allowed_roles)
+        for item in items
+    ]
     return members, response.get("LastEvaluatedKey")
 
 
@@ -618,23 +925,13 @@ def team_name_exists(teams_table, team_name: str) -> bool:
         response = teams_table.query(
             IndexName=TEAM_NAME_INDEX,
             KeyConditionExpression=Key("teamName").eq(team_name),
+            Select="COUNT",
             Limit=1,
         )
-        if response.get("Items"):
-            return True
+        return response.get("Count", 0) > 0
     except Exception as err:
-        if ClientError and isinstance(err, ClientError):
-            error_code = err.response.get("Error", {}).get("Code")
-            if error_code not in {"ValidationException", "ResourceNotFoundException"}:
-                raise
-        else:
-            raise
-
-    response = teams_table.scan(
-        FilterExpression=Attr("teamName").eq(team_name),
-        Limit=1,
-    )
-    return bool(response.get("Items"))
+        _raise_for_missing_index("team_name_exists", TEAM_NAME_INDEX, TEAMS_TABLE_NAME, err)
+        raise
 
 
 def get_team_by_name(teams_table, team_name: str) -> dict | None:
@@ -651,21 +948,10 @@ def get_team_by_name(teams_table, team_name: str) -> dict | None:
             Limit=1,
         )
         items = response.get("Items") or []
-        if items:
-            return items[0]
+        return items[0] if items else None
     except Exception as err:
-        if ClientError and isinstance(err, ClientError):
-            error_code = err.response.get("Error", {}).get("Code")
-            if error_code not in {"ValidationException", "ResourceNotFoundException"}:
-                raise
-        else:
-            raise
-
-    items = scan_all(
-        teams_table,
-        FilterExpression=Attr("teamName").eq(team_name),
-    )
-    return items[0] if items else None
+        _raise_for_missing_index("get_team_by_name", TEAM_NAME_INDEX, TEAMS_TABLE_NAME, err)
+        raise
 
 
 def display_name_exists(
@@ -804,6 +1090,7 @@ def update_email_update_interval(user_id: str, value, unit) -> dict:
         },
         ReturnValues="ALL_NEW",
     )
+    invalidate_user_team_roster(get_team_members_table(), user_id)
 
     attrs = response.get("Attributes", {})
     return {
@@ -819,3 +1106,4 @@ def update_coach_summary_sent_at(user_id: str, sent_at: str) -> None:
         UpdateExpression="SET lastCoachSummarySentAt = :sentAt",
         ExpressionAttributeValues={":sentAt": sent_at},
     )
+    invalidate_user_team_roster(get_team_members_table(), user_id)
@@ -0,0 +1,61 @@
+"""Thread fan-out for independent, I/O-bound AWS calls."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _env_workers(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %d", name, raw, default)
+        return default
+
+
+AWS_FANOUT_WORKERS = _env_workers("ROWLYTICS_AWS_FANOUT_WORKERS", 8)
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def _mark_worker() -> None:
+    _worker_state.in_pool = True
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=AWS_FANOUT_WORKERS,
+                    thread_name_prefix="aws-fanout",
+                    initializer=_mark_worker,
+                )
+    return _executor
+
+
+def run_fanout(func, items) -> list:
+    """Apply an I/O-bound AWS call to each item, overlapping the round-trips.
+
+    Results come back in input order, and the first exception raised by
+    ``func`` propagates to the caller. Calls made from inside a pool worker
+    run inline, since waiting on the shared pool from one of its own
+    threads could deadlock it.
+    """
+    items = list(items)
+    if len(items) <= 1 or getattr(_worker_state, "in_pool", False):
+        return [func(item) for item in items]
+    return list(_get_executor().map(func, items))
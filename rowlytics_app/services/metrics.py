@@ -1,12 +1,38 @@
 from __future__ import annotations
 
-import boto3
+from rowlytics_app.services.aws_config import AWS_CLIENT_CONFIG
 
-cloudwatch = boto3.client("cloudwatch", region_name="us-east-2")
+try:
+    import boto3
+except ImportError:  # pragma: no cover - boto3 only needed when AWS is used
+    boto3 = None
+
+_cloudwatch = None
+
+
+def reset_client_cache() -> None:
+    """Drop the cached CloudWatch client (used by tests)."""
+    global _cloudwatch
+    _cloudwatch = None
+
+
+def _get_cloudwatch_client():
+    # Built on first use so importing the routes doesn't construct a client
+    # that only the sign-in callback needs.
+    global _cloudwatch
+    if boto3 is None:
+        raise RuntimeError("boto3 is required for CloudWatch access")
+    if _cloudwatch is None:
+        _cloudwatch = boto3.client(
+            "cloudwatch",
+            region_name="us-east-2",
+            config=AWS_CLIENT_CONFIG,
+        )
+    return _cloudwatch
 
 
 def publish_login_latency(latency_ms: float, environment: str) -> None:
-    cloudwatch.put_metric_data(
+    _get_cloudwatch_client().put_metric_data(
         Namespace="Erg-lytics/Auth",
         MetricData=[
             {
@@ -5,6 +5,9 @@ from __future__ import annotations
 import logging
 import os
 
+from rowlytics_app.services.aws_config import AWS_CLIENT_CONFIG
+from rowlytics_app.services.cache import TTLCache, env_ttl
+
 try:
     import boto3
 except ImportError:  # pragma: no cover - boto3 only needed when AWS is used
@@ -13,14 +16,61 @@ except ImportError:  # pragma: no cover - boto3 only needed when AWS is used
 logger = logging.getLogger(__name__)
 
 UPLOAD_BUCKET_NAME = os.getenv("ROWLYTICS_UPLOAD_BUCKET", "rowlyticsuploads")
+DELETE_OBJECTS_MAX_KEYS = 1000
+PLAYBACK_URL_EXPIRES_SECONDS = 900
+# Reused URLs keep at least 300s of validity: expiry (900s) minus cache TTL.
+PLAYBACK_URL_CACHE_TTL_SECONDS = min(
+    env_ttl("ROWLYTICS_PLAYBACK_URL_CACHE_TTL", 600.0),
+    PLAYBACK_URL_EXPIRES_SECONDS - 300,
+)
+
+_client = None
+_playback_url_cache = TTLCache(PLAYBACK_URL_CACHE_TTL_SECONDS, maxsize=4096)
+
+
+def reset_client_cache() -> None:
+    """Drop the cached S3 client (used by tests)."""
+    global _client
+    _client = None
 
 
 def get_s3_client():
+    global _client
     if boto3 is None:
         logger.error("boto3 is not installed")
         raise RuntimeError("boto3 is required for S3 access")
     if not UPLOAD_BUCKET_NAME:
         logger.error("ROWLYTICS_UPLOAD_BUCKET environment variable is not configured")
         raise RuntimeError("ROWLYTICS_UPLOAD_BUCKET is not configured")
-    logger.debug(f"Creating S3 client for bucket: {UPLOAD_BUCKET_NAME}")
-    return boto3.client("s3")
+    if _client is None:
+        logger.debug("Creating S3 client for bucket: %s", UPLOAD_BUCKET_NAME)
+        _client = boto3.client("s3", config=AWS_CLIENT_CONFIG)
+    return _client
+
+
+def presign_playback_url(s3, object_key: str) -> str:
+    """Return a GET URL for a recording, reusing one signed recently for the same key."""
+    cached = _playback_url_cache.get(object_key)
+    if cached is not None:
+        return cached
+    url = s3.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": UPLOAD_BUCKET_NAME, "Key": object_key},
+        ExpiresIn=PLAYBACK_URL_EXPIRES_SECONDS,
+    )
+    _playback_url_cache.set(object_key, url)
+    return url
+
+
+def delete_object_keys(s3, object_keys) -> list[str]:
+    """Delete objects with DeleteObjects and return the keys S3 could not remove."""
+    object_keys = list(object_keys)
+    failed = []
+    for start in range(0, len(object_keys), DELETE_OBJECTS_MAX_KEYS):
+        chunk = object_keys[start:start + DELETE_OBJECTS_MAX_KEYS]
+        response = s3.delete_objects(
+            Bucket=UPLOAD_BUCKET_NAME,
+            Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+        )
+        failed.extend(error.get("Key") for error in response.get("Errors") or [])
+    return failed
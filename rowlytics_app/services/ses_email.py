@@ -3,6 +3,28 @@ import os
 import boto3
 from botocore.exceptions import ClientError
 
+from rowlytics_app.services.aws_config import AWS_CLIENT_CONFIG
+
+_clients: dict = {}
+
+
+def reset_client_cache() -> None:
+    """Drop the cached SES clients (used by tests)."""
+    _clients.clear()
+
+
+def _get_ses_client(aws_region: str):
+    # Weekly summaries send one email per coach, so reuse the client and its
+    # connection pool instead of rebuilding it for every message.
+    client = _clients.get(aws_region)
+    if client is None:
+        client = _clients[aws_region] = boto3.client(
+            "ses",
+            region_name=aws_region,
+            config=AWS_CLIENT_CONFIG,
+        )
+    return client
+
 
 def send_email(to_email: str, subject: str, body_text: str, body_html: str | None = None) -> str:
     aws_region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION", "us-east-2")
@@ -11,7 +33,7 @@ def send_email(to_email: str, subject: str, body_text: str, body_html: str | Non
     if not from_email:
         raise ValueError("SES_FROM_EMAIL is not set")
 
-    ses = boto3.client("ses", region_name=aws_region)
+    ses = _get_ses_client(aws_region)
 
     message = {
         "Subject": {"Data": subject, "Charset": "UTF-8"},
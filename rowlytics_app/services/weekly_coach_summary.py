@@ -52,6 +52,8 @@ def _get_team_and_members(team_id: str):
         team_members_table,
         team_id,
         allowed_roles={"coach", "rower"},
+        # The send decision reads each coach's interval and last-sent time.
+        use_cache=False,
     )
     return team, members
 
@@ -62,11 +64,12 @@ def _list_all_teams() -> list[dict]:
 
 def _weekly_workouts_for_rowers(rower_ids: list[str]) -> list[dict]:
     workouts_table = get_workouts_table()
-    week_start = _iso(_utc_now() - timedelta(days=7))
+    week_start_dt = _utc_now() - timedelta(days=7)
+    week_start = _iso(week_start_dt)
 
     workouts = []
     for user_id in rower_ids:
-        for workout in list_workouts(workouts_table, user_id):
+        for workout in list_workouts(workouts_table, user_id, completed_from=week_start_dt):
             completed_at = workout.get("completedAt") or workout.get("createdAt") or ""
             if completed_at >= week_start:
                 workouts.append(workout)
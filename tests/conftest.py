@@ -4,7 +4,30 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure project root is importable when running tests directly (e.g., `pytest -q`).
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _reset_aws_client_caches():
+    from rowlytics_app.auth import cognito
+    from rowlytics_app.services import dynamodb, metrics, s3, ses_email
+
+    for module in (dynamodb, s3, cognito, metrics, ses_email):
+        module.reset_client_cache()
+    yield
+    for module in (dynamodb, s3, cognito, metrics, ses_email):
+        module.reset_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_read_caches():
+    from rowlytics_app.services.cache import clear_all_caches
+
+    clear_all_caches()
+    yield
+    clear_all_caches()
@@ -0,0 +1,149 @@
+"""Tests for account management API routes."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+from rowlytics_app import create_app
+
+
+@pytest.fixture()
+def app() -> Flask:
+    flask_app = create_app()
+    flask_app.config.update(TESTING=True, AUTH_REQUIRED=False)
+    return flask_app
+
+
+@pytest.fixture()
+def client(app: Flask) -> FlaskClient:
+    return app.test_client()
+
+
+def test_delete_account_removes_recordings_memberships_and_user(
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    users_table = MagicMock()
+    team_members_table = MagicMock()
+    recordings_table = MagicMock()
+    s3 = MagicMock()
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_ddb_tables",
+        lambda: (users_table, team_members_table),
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.get_recordings_table", lambda: recordings_table)
+    monkeypatch.setattr("rowlytics_app.api_routes.get_s3_client", lambda: s3)
+    monkeypatch.setattr("rowlytics_app.api_routes.delete_cognito_user", lambda *_args: None)
+    pages = [
+        [
+            {"recordingId": f"r{idx}", "objectKey": f"recordings/user-123/r{idx}.webm"}
+            for idx in page
+        ]
+        for page in ((0, 1), (2,))
+    ]
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.iter_recording_key_pages",
+        lambda _table, _user_id: iter(pages),
+    )
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.list_team_memberships",
+        lambda _table, _user_id: [{"teamId": "t1"}, {"teamId": "t2"}],
+    )
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-123"
+
+    response = client.post("/api/account/delete")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "ok"}
+    deleted_keys = sorted(
+        obj["Key"]
+        for call in s3.delete_objects.call_args_list
+        for obj in call.kwargs["Delete"]["Objects"]
+    )
+    assert s3.delete_objects.call_count == 2
+    assert deleted_keys == [f"recordings/user-123/r{idx}.webm" for idx in range(3)]
+    recording_batch = recordings_table.batch_writer.return_value.__enter__.return_value
+    assert sorted(
+        call.kwargs["Key"]["recordingId"] for call in recording_batch.delete_item.call_args_list
+    ) == ["r0", "r1", "r2"]
+    recordings_table.delete_item.assert_not_called()
+    membership_batch = team_members_table.batch_writer.return_value.__enter__.return_value
+    assert [
+        call.kwargs["Key"] for call in membership_batch.delete_item.call_args_list
+    ] == [{"teamId": "t1", "userId": "user-123"}, {"teamId": "t2", "userId": "user-123"}]
+    users_table.delete_item.assert_called_once_with(Key={"userId": "user-123"})
+
+
+def test_delete_account_without_recordings_skips_s3(
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    users_table = MagicMock()
+    team_members_table = MagicMock()
+    recordings_table = MagicMock()
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_ddb_tables",
+        lambda: (users_table, team_members_table),
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.get_recordings_table", lambda: recordings_table)
+
+    def fail_s3():
+        raise AssertionError("S3 should not be needed without recordings")
+
+    monkeypatch.setattr("rowlytics_app.api_routes.get_s3_client", fail_s3)
+    monkeypatch.setattr("rowlytics_app.api_routes.delete_cognito_user", lambda *_args: None)
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.iter_recording_key_pages",
+        lambda _table, _user_id: iter([[]]),
+    )
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.list_team_memberships",
+        lambda _table, _user_id: [],
+    )
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-123"
+
+    response = client.post("/api/account/delete")
+
+    assert response.status_code == 200
+    recordings_table.batch_writer.assert_not_called()
+    users_table.delete_item.assert_called_once_with(Key={"userId": "user-123"})
+
+
+def test_delete_account_reports_recording_delete_failure(
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    users_table = MagicMock()
+    recordings_table = MagicMock()
+    recordings_table.batch_writer.side_effect = RuntimeError("throttled")
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_ddb_tables",
+        lambda: (users_table, MagicMock()),
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.get_recordings_table", lambda: recordings_table)
+    monkeypatch.setattr("rowlytics_app.api_routes.get_s3_client", MagicMock)
+    monkeypatch.setattr("rowlytics_app.api_routes.delete_cognito_user", lambda *_args: None)
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.iter_recording_key_pages",
+        lambda _table, _user_id: iter([[{"recordingId": "r0", "objectKey": "k0"}]]),
+    )
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.list_team_memberships",
+        lambda _table, _user_id: [],
+    )
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-123"
+
+    response = client.post("/api/account/delete")
+
+    assert response.status_code == 500
+    assert response.get_json() == {"error": "Unable to delete recordings", "detail": "throttled"}
+    users_table.delete_item.assert_not_called()
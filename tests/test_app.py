@@ -90,3 +90,40 @@ def test_signin_route_renders(client: FlaskClient) -> None:
 def test_static_css_loads(client: FlaskClient) -> None:
     response = client.get("/static/css/styles.css")
     assert response.status_code == 200
+
+
+def test_create_app_warms_aws_clients_on_lambda(monkeypatch: pytest.MonkeyPatch) -> None:
+    import rowlytics_app
+
+    calls = []
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "rowlytics")
+    monkeypatch.setattr(rowlytics_app, "get_ddb_tables", lambda: calls.append("ddb"))
+    monkeypatch.setattr(rowlytics_app, "get_teams_table", lambda: calls.append("teams"))
+    monkeypatch.setattr(rowlytics_app, "get_recordings_table", lambda: calls.append("recordings"))
+    monkeypatch.setattr(rowlytics_app, "get_s3_client", lambda: calls.append("s3"))
+
+    create_app()
+
+    assert calls == ["ddb", "teams", "recordings", "s3"]
+
+
+def test_require_auth_stashes_session_user_on_g(app: Flask, client: FlaskClient) -> None:
+    from flask import g
+
+    from rowlytics_app.auth.sessions import current_user_id
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-123"
+
+    with client:
+        client.get("/")
+        assert g.user_id == "user-123"
+        assert current_user_id() == "user-123"
+
+
+def test_health_check_returns_static_cacheable_body(client: FlaskClient) -> None:
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "ok", "service": "rowlytics-api"}
+    assert response.headers["Cache-Control"] == "public, max-age=5"
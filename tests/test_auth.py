@@ -96,7 +96,7 @@ def test_get_cognito_client_returns_client(monkeypatch: pytest.MonkeyPatch) -> N
     boto.client.return_value = client
     monkeypatch.setattr(cognito, "boto3", boto)
     assert cognito._get_cognito_client() is client
-    boto.client.assert_called_once_with("cognito-idp")
+    boto.client.assert_called_once_with("cognito-idp", config=cognito.AWS_CLIENT_CONFIG)
 
 
 def test_delete_cognito_user_uses_access_token(monkeypatch: pytest.MonkeyPatch) -> None:
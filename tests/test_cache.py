@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from rowlytics_app.services import cache
+
+
+def test_ttl_cache_returns_value_until_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = cache.TTLCache(ttl=30)
+
+    ttl_cache.set("team1", ["member"])
+    assert ttl_cache.get("team1") == ["member"]
+
+    now[0] += 31
+    assert ttl_cache.get("team1") is None
+
+
+def test_ttl_cache_evicts_oldest_entry_at_maxsize() -> None:
+    ttl_cache = cache.TTLCache(ttl=30, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    assert ttl_cache.get("c") == 3
+
+
+def test_ttl_cache_with_zero_ttl_is_disabled() -> None:
+    ttl_cache = cache.TTLCache(ttl=0)
+    ttl_cache.set("a", 1)
+    assert ttl_cache.get("a") is None
+
+
+def test_clear_all_caches_empties_every_instance() -> None:
+    first = cache.TTLCache(ttl=30)
+    second = cache.TTLCache(ttl=30)
+    first.set("a", 1)
+    second.set("b", 2)
+
+    cache.clear_all_caches()
+
+    assert first.get("a") is None
+    assert second.get("b") is None
+
+
+def test_env_ttl_falls_back_on_invalid_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ROWLYTICS_TEST_TTL", "soon")
+    assert cache.env_ttl("ROWLYTICS_TEST_TTL", 30.0) == 30.0
+    monkeypatch.setenv("ROWLYTICS_TEST_TTL", "-5")
+    assert cache.env_ttl("ROWLYTICS_TEST_TTL", 30.0) == 0.0
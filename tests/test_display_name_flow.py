@@ -76,6 +76,17 @@ def test_auth_callback_redirects_established_user_to_home(
         assert session["user_name"] == "Boat Mover"
 
 
+def test_api_health_is_public_while_other_api_routes_require_session(
+    client: FlaskClient,
+) -> None:
+    assert client.get("/api/health").status_code == 200
+
+    response = client.get("/api/team/current")
+
+    assert response.status_code == 401
+    assert response.get_json() == {"error": "authentication required"}
+
+
 def test_signed_in_user_is_gated_to_display_name_setup(client: FlaskClient) -> None:
     with client.session_transaction() as session:
         session["user_id"] = "user-1"
@@ -131,14 +142,22 @@ def test_update_account_name_clears_onboarding_flag_on_success(
         session["user_email"] = "rower@example.com"
         session["display_name_required"] = True
 
-    monkeypatch.setattr(api_routes, "get_ddb_tables", lambda: (users_table, MagicMock()))
+    team_members_table = MagicMock()
+    invalidated = []
+    monkeypatch.setattr(api_routes, "get_ddb_tables", lambda: (users_table, team_members_table))
     monkeypatch.setattr(api_routes, "display_name_exists", lambda *_args, **_kwargs: False)
+    monkeypatch.setattr(
+        api_routes,
+        "invalidate_user_team_roster",
+        lambda table, user_id: invalidated.append((table, user_id)),
+    )
 
     response = client.post("/api/account/name", json={"name": "Boat Mover"})
 
     assert response.status_code == 200
     assert response.get_json() == {"status": "ok", "name": "Boat Mover"}
     users_table.update_item.assert_called_once()
+    assert invalidated == [(team_members_table, "user-1")]
     with client.session_transaction() as session:
         assert session["display_name_required"] is False
         assert session["user_name"] == "Boat Mover"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -49,7 +49,21 @@ def test_get_resource_uses_boto3_resource(monkeypatch: pytest.MonkeyPatch) -> No
     boto.resource.return_value = resource
     monkeypatch.setattr(dynamodb, "boto3", boto)
     assert dynamodb._get_resource() is resource
-    boto.resource.assert_called_once_with("dynamodb")
+    boto.resource.assert_called_once_with("dynamodb", config=dynamodb.AWS_CLIENT_CONFIG)
+
+
+def test_get_resource_is_cached_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    boto = MagicMock()
+    monkeypatch.setattr(dynamodb, "boto3", boto)
+    assert dynamodb._get_resource() is dynamodb._get_resource()
+    boto.resource.assert_called_once_with("dynamodb", config=dynamodb.AWS_CLIENT_CONFIG)
+
+
+def test_table_handles_are_cached_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    resource = MagicMock()
+    monkeypatch.setattr(dynamodb, "_get_resource", lambda: resource)
+    assert dynamodb.get_users_table() is dynamodb.get_users_table()
+    resource.Table.assert_called_once_with(dynamodb.USERS_TABLE_NAME)
 
 
 def test_get_users_table_returns_table(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -145,10 +159,10 @@ def test_batch_get_users_returns_empty_dict_when_no_ids(monkeypatch: pytest.Monk
 def test_batch_get_users_handles_chunking(monkeypatch: pytest.MonkeyPatch) -> None:
     user_ids = [f"id{i}" for i in range(120)]
     client = MagicMock()
-    client.batch_get_item.side_effect = [
-        {"Responses": {"Users": [{"userId": f"id{i}"} for i in range(100)]}},
-        {"Responses": {"Users": [{"userId": f"id{i}"} for i in range(100, 120)]}},
-    ]
+    # Chunks may be fetched concurrently, so answer from each request's keys.
+    client.batch_get_item.side_effect = lambda RequestItems: {
+        "Responses": {"Users": list(RequestItems["Users"]["Keys"])}
+    }
     table = MagicMock()
     table.name = "Users"
     table.meta = SimpleNamespace(client=client)
@@ -161,6 +175,55 @@ def test_batch_get_users_handles_chunking(monkeypatch: pytest.MonkeyPatch) -> No
     assert client.batch_get_item.call_count == 2
 
 
+def test_batch_get_users_dedupes_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = MagicMock()
+    client.batch_get_item.return_value = {"Responses": {"Users": [{"userId": "u1"}]}}
+    table = MagicMock()
+    table.name = "Users"
+    table.meta = SimpleNamespace(client=client)
+
+    dynamodb.batch_get_users(table, ["u1", "u2", "u1"])
+
+    request = client.batch_get_item.call_args.kwargs["RequestItems"]["Users"]
+    assert request["Keys"] == [{"userId": "u1"}, {"userId": "u2"}]
+
+
+def test_batch_get_users_projects_summary_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = MagicMock()
+    client.batch_get_item.return_value = {"Responses": {"Users": [{"userId": "u1"}]}}
+    table = MagicMock()
+    table.name = "Users"
+    table.meta = SimpleNamespace(client=client)
+
+    dynamodb.batch_get_users(table, ["u1"])
+
+    request = client.batch_get_item.call_args.kwargs["RequestItems"]["Users"]
+    assert request["ProjectionExpression"] == dynamodb.USER_SUMMARY_PROJECTION
+    assert request["ExpressionAttributeNames"] == {"#name": "name"}
+
+
+def test_batch_get_users_retries_unprocessed_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dynamodb.time, "sleep", lambda _seconds: None)
+    client = MagicMock()
+    client.batch_get_item.side_effect = [
+        {
+            "Responses": {"Users": [{"userId": "u1"}]},
+            "UnprocessedKeys": {"Users": {"Keys": [{"userId": "u2"}]}},
+        },
+        {"Responses": {"Users": [{"userId": "u2"}]}},
+    ]
+    table = MagicMock()
+    table.name = "Users"
+    table.meta = SimpleNamespace(client=client)
+
+    result = dynamodb.batch_get_users(table, ["u1", "u2"])
+
+    assert set(result) == {"u1", "u2"}
+    assert client.batch_get_item.call_args_list[1].kwargs["RequestItems"] == {
+        "Users": {"Keys": [{"userId": "u2"}]}
+    }
+
+
 def test_batch_get_users_propagates_exception(monkeypatch: pytest.MonkeyPatch) -> None:
     client = MagicMock()
     client.batch_get_item.side_effect = Exception("fail")
@@ -202,10 +265,150 @@ def test_fetch_team_members_merges_users_and_normalizes_roles(
     assert members[0]["email"] == "c@example.com"
 
 
+def test_fetch_team_members_caches_roster_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    team_members_table = MagicMock()
+    team_members_table.query.return_value = {
+        "Items": [{"userId": "u1", "memberRole": "rower"}]
+    }
+    monkeypatch.setattr(dynamodb, "batch_get_users", lambda _table, ids: {})
+
+    def fetch():
+        return dynamodb.fetch_team_members(
+            users_table=MagicMock(),
+            team_members_table=team_members_table,
+            team_id="team1",
+            allowed_roles={"coach", "rower"},
+        )
+
+    assert fetch() == fetch()
+    assert team_members_table.query.call_count == 1
+
+    dynamodb.invalidate_team_members("team1")
+    fetch()
+    assert team_members_table.query.call_count == 2
+
+
+def test_fetch_team_members_can_bypass_cached_roster(monkeypatch: pytest.MonkeyPatch) -> None:
+    team_members_table = MagicMock()
+    team_members_table.query.return_value = {
+        "Items": [{"userId": "u1", "memberRole": "coach"}]
+    }
+    monkeypatch.setattr(dynamodb, "batch_get_users", lambda _table, ids: {})
+
+    for use_cache in (True, False):
+        dynamodb.fetch_team_members(
+            MagicMock(),
+            team_members_table,
+            "team1",
+            {"coach", "rower"},
+            use_cache=use_cache,
+        )
+
+    assert team_members_table.query.call_count == 2
+
+
+def test_update_coach_summary_sent_at_invalidates_team_roster(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    team_members_table = MagicMock()
+    monkeypatch.setattr(dynamodb, "get_users_table", MagicMock)
+    monkeypatch.setattr(dynamodb, "get_team_members_table", lambda: team_members_table)
+    monkeypatch.setattr(
+        dynamodb,
+        "get_team_membership",
+        lambda table, user_id: {"teamId": "team1"} if table is team_members_table else None,
+    )
+    dynamodb._team_members_cache.set("team1", (frozenset({"coach"}), []))
+
+    dynamodb.update_coach_summary_sent_at("u1", "2026-10-14T00:00:00+00:00")
+
+    assert dynamodb._team_members_cache.get("team1") is None
+
+
+def test_fetch_team_members_skips_user_lookup_for_empty_team(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    team_members_table = MagicMock()
+    team_members_table.query.return_value = {"Items": []}
+
+    def fail_batch_get_users(*_args):
+        raise AssertionError("batch_get_users should not be called")
+
+    monkeypatch.setattr(dynamodb, "batch_get_users", fail_batch_get_users)
+
+    members = dynamodb.fetch_team_members(
+        users_table=MagicMock(),
+        team_members_table=team_members_table,
+        team_id="team1",
+        allowed_roles={"coach", "rower"},
+    )
+
+    assert members == []
+
+
+def test_put_team_membership_checks_team_and_puts_member_atomically() -> None:
+    teams_table = MagicMock()
+    teams_table.name = "Teams"
+    team_members_table = MagicMock()
+    team_members_table.name = "TeamMembers"
+    item = {"teamId": "t1", "userId": "u1", "memberRole": "rower"}
+
+    dynamodb.put_team_membership(teams_table, team_members_table, item)
+
+    transact = team_members_table.meta.client.transact_write_items
+    transact.assert_called_once()
+    check, put = transact.call_args.kwargs["TransactItems"]
+    assert check["ConditionCheck"]["TableName"] == "Teams"
+    assert check["ConditionCheck"]["Key"] == {"teamId": "t1"}
+    assert put["Put"]["TableName"] == "TeamMembers"
+    assert put["Put"]["Item"] == item
+
+
+def test_put_team_with_owner_writes_both_rows_atomically() -> None:
+    teams_table = MagicMock()
+    teams_table.name = "Teams"
+    team_members_table = MagicMock()
+    team_members_table.name = "TeamMembers"
+    team_item = {"teamId": "t1", "teamName": "Crew", "coachUserId": "u1"}
+    member_item = {"teamId": "t1", "userId": "u1", "memberRole": "coach"}
+
+    dynamodb.put_team_with_owner(teams_table, team_members_table, team_item, member_item)
+
+    transact = team_members_table.meta.client.transact_write_items
+    transact.assert_called_once()
+    team_put, member_put = transact.call_args.kwargs["TransactItems"]
+    assert team_put["Put"]["TableName"] == "Teams"
+    assert team_put["Put"]["Item"] == team_item
+    assert member_put["Put"]["TableName"] == "TeamMembers"
+    assert member_put["Put"]["Item"] == member_item
+    teams_table.put_item.assert_not_called()
+    team_members_table.put_item.assert_not_called()
+
+
+def test_transaction_cancellation_codes_reads_reasons() -> None:
+    err = ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}],
+        },
+        "TransactWriteItems",
+    )
+
+    assert dynamodb.transaction_cancellation_codes(err) == ["None", "ConditionalCheckFailed"]
+    assert dynamodb.transaction_cancellation_codes(make_client_error("Other")) == []
+    assert dynamodb.transaction_cancellation_codes(ValueError("x")) == []
+
+
 def test_get_team_membership_returns_first_item(monkeypatch: pytest.MonkeyPatch) -> None:
     table = MagicMock()
     table.query.return_value = {"Items": [{"teamId": "t1"}]}
     assert dynamodb.get_team_membership(table, "u1") == {"teamId": "t1"}
+    kwargs = table.query.call_args.kwargs
+    assert kwargs["IndexName"] == dynamodb.TEAM_MEMBERS_USER_INDEX
+    assert kwargs["Limit"] == 1
+    assert kwargs["ProjectionExpression"] == dynamodb.MEMBERSHIP_PROJECTION
 
 
 def test_get_team_membership_returns_none_when_missing(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -214,16 +417,15 @@ def test_get_team_membership_returns_none_when_missing(monkeypatch: pytest.Monke
     assert dynamodb.get_team_membership(table, "u1") is None
 
 
-def test_get_team_membership_fallbacks_to_scan_on_validation_error(
+def test_get_team_membership_requires_user_index(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     table = MagicMock()
     table.query.side_effect = make_client_error("ValidationException")
-    table.scan.return_value = {"Items": [{"userId": "u1", "teamId": "t1"}]}
 
-    result = dynamodb.get_team_membership(table, "u1")
-    assert result == {"userId": "u1", "teamId": "t1"}
-    table.scan.assert_called_once()
+    with pytest.raises(RuntimeError, match=dynamodb.TEAM_MEMBERS_USER_INDEX):
+        dynamodb.get_team_membership(table, "u1")
+    table.scan.assert_not_called()
 
 
 def test_get_team_membership_reraises_unexpected_client_error(
@@ -235,6 +437,24 @@ def test_get_team_membership_reraises_unexpected_client_error(
         dynamodb.get_team_membership(table, "u1")
 
 
+def test_get_team_membership_caches_lookups_until_invalidated() -> None:
+    table = MagicMock()
+    table.query.return_value = {"Items": []}
+
+    assert dynamodb.get_team_membership(table, "u1") is None
+    assert dynamodb.get_team_membership(table, "u1") is None
+    assert table.query.call_count == 1
+
+    table.query.return_value = {"Items": [{"teamId": "t1"}]}
+    assert dynamodb.get_team_membership(table, "u1", use_cache=False) == {"teamId": "t1"}
+    assert dynamodb.get_team_membership(table, "u1") == {"teamId": "t1"}
+    assert table.query.call_count == 2
+
+    dynamodb.invalidate_team_membership("u1")
+    dynamodb.get_team_membership(table, "u1")
+    assert table.query.call_count == 3
+
+
 def test_get_team_returns_item() -> None:
     table = MagicMock()
     table.get_item.return_value = {"Item": {"teamId": "t1"}}
@@ -247,6 +467,18 @@ def test_get_team_returns_none_when_not_found() -> None:
     assert dynamodb.get_team(table, "t1") is None
 
 
+def test_get_team_caches_found_teams_until_invalidated() -> None:
+    table = MagicMock()
+    table.get_item.return_value = {"Item": {"teamId": "t1"}}
+
+    assert dynamodb.get_team(table, "t1") == dynamodb.get_team(table, "t1")
+    assert table.get_item.call_count == 1
+
+    dynamodb.invalidate_team("t1")
+    dynamodb.get_team(table, "t1")
+    assert table.get_item.call_count == 2
+
+
 def test_get_team_propagates_errors() -> None:
     table = MagicMock()
     table.get_item.side_effect = Exception("boom")
@@ -254,6 +486,35 @@ def test_get_team_propagates_errors() -> None:
         dynamodb.get_team(table, "t1")
 
 
+def test_iter_query_pages_prefetch_requests_next_page_before_yielding() -> None:
+    table = MagicMock()
+    table.query.side_effect = [
+        {"Items": [{"id": 1}], "LastEvaluatedKey": {"id": 1}},
+        {"Items": [{"id": 2}]},
+    ]
+
+    pages = dynamodb.iter_query_pages_prefetch(table, KeyConditionExpression="cond")
+
+    assert next(pages) == [{"id": 1}]
+    assert next(pages) == [{"id": 2}]
+    assert next(pages, None) is None
+    first_call, second_call = table.query.call_args_list
+    assert "ExclusiveStartKey" not in first_call.kwargs
+    assert second_call.kwargs == {"KeyConditionExpression": "cond", "ExclusiveStartKey": {"id": 1}}
+
+
+def test_iter_recording_key_pages_projects_keys_only() -> None:
+    table = MagicMock()
+    table.query.return_value = {"Items": [{"recordingId": "r1", "objectKey": "k1"}]}
+
+    assert list(dynamodb.iter_recording_key_pages(table, "u1")) == [
+        [{"recordingId": "r1", "objectKey": "k1"}]
+    ]
+    kwargs = table.query.call_args.kwargs
+    assert kwargs["ProjectionExpression"] == "recordingId, objectKey"
+    assert "IndexName" not in kwargs
+
+
 def test_query_all_handles_multiple_pages() -> None:
     table = MagicMock()
     table.query.side_effect = [
@@ -321,18 +582,20 @@ def test_list_team_memberships_uses_query_all(monkeypatch: pytest.MonkeyPatch) -
     assert called["kwargs"]["IndexName"] == dynamodb.TEAM_MEMBERS_USER_INDEX
 
 
-def test_list_team_memberships_falls_back_to_scan_on_validation_error(
+def test_list_team_memberships_requires_user_index(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     def raise_query_all(*_, **__):
         raise make_client_error("ValidationException")
 
+    def fail_scan_all(*_, **__):
+        raise AssertionError("scan should not be used")
+
     monkeypatch.setattr(dynamodb, "query_all", raise_query_all)
-    monkeypatch.setattr(dynamodb, "scan_all", lambda *_, **__: ["fallback"])
+    monkeypatch.setattr(dynamodb, "scan_all", fail_scan_all)
 
-    table = MagicMock()
-    result = dynamodb.list_team_memberships(table, "u1")
-    assert result == ["fallback"]
+    with pytest.raises(RuntimeError, match=dynamodb.TEAM_MEMBERS_USER_INDEX):
+        dynamodb.list_team_memberships(MagicMock(), "u1")
 
 
 def test_list_team_members_by_team_delegates_to_query_all(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -348,6 +611,7 @@ def test_list_team_members_by_team_delegates_to_query_all(monkeypatch: pytest.Mo
 
     assert result == ["member"]
     assert "KeyConditionExpression" in captured
+    assert captured["ProjectionExpression"] == dynamodb.MEMBERSHIP_PROJECTION
 
 
 def test_list_owned_teams_returns_empty_when_attr_missing(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -355,7 +619,33 @@ def test_list_owned_teams_returns_empty_when_attr_missing(monkeypatch: pytest.Mo
     assert dynamodb.list_owned_teams(MagicMock(), "u1") == []
 
 
-def test_list_owned_teams_calls_scan_all(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_list_owned_teams_queries_coach_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = {}
+
+    def fake_query_all(_table, **kwargs):
+        captured.update(kwargs)
+        return ["owned"]
+
+    def fail_scan_all(*_args, **_kwargs):
+        raise AssertionError("scan should not be used")
+
+    monkeypatch.setattr(dynamodb, "query_all", fake_query_all)
+    monkeypatch.setattr(dynamodb, "scan_all", fail_scan_all)
+
+    result = dynamodb.list_owned_teams(MagicMock(), "coach123")
+
+    assert result == ["owned"]
+    assert captured["IndexName"] == dynamodb.TEAMS_COACH_INDEX
+
+
+def test_list_owned_teams_scans_when_coach_index_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def raise_query_all(*_args, **_kwargs):
+        raise ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "missing index"}},
+            "Query",
+        )
+
+    monkeypatch.setattr(dynamodb, "query_all", raise_query_all)
     monkeypatch.setattr(dynamodb, "scan_all", lambda *_, **__: ["owned"])
     result = dynamodb.list_owned_teams(MagicMock(), "coach123")
     assert result == ["owned"]
@@ -429,6 +719,56 @@ def test_list_workouts_page_applies_completed_at_range(
     )
 
 
+def test_list_workouts_bounds_completed_at_on_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = {}
+
+    def fake_query_all(_table, **kwargs):
+        captured.update(kwargs)
+        return ["workout"]
+
+    monkeypatch.setattr(dynamodb, "query_all", fake_query_all)
+
+    result = dynamodb.list_workouts(
+        MagicMock(),
+        "u1",
+        completed_from=datetime(2026, 4, 8, tzinfo=timezone.utc),
+    )
+
+    assert result == ["workout"]
+    assert captured["IndexName"] == dynamodb.WORKOUTS_COMPLETED_AT_INDEX
+    condition = captured["KeyConditionExpression"].get_expression()
+    assert condition["operator"] == "AND"
+    date_condition = condition["values"][1].get_expression()
+    assert date_condition["operator"] == ">="
+    assert date_condition["values"][1] == "2026-04-07T00:00:00+00:00"
+
+
+def test_list_workouts_widens_range_for_offset_timestamps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured = {}
+    monkeypatch.setattr(
+        dynamodb,
+        "query_all",
+        lambda _table, **kwargs: captured.update(kwargs) or [],
+    )
+
+    dynamodb.list_workouts(
+        MagicMock(),
+        "u1",
+        completed_from=datetime(2026, 10, 8, tzinfo=timezone.utc),
+        completed_to=datetime(2026, 10, 15, tzinfo=timezone.utc),
+    )
+
+    date_condition = captured["KeyConditionExpression"].get_expression()["values"][1]
+    expression = date_condition.get_expression()
+    assert expression["operator"] == "BETWEEN"
+    lower, upper = expression["values"][1:]
+    assert (lower, upper) == ("2026-10-07T00:00:00+00:00", "2026-10-16T00:00:00+00:00")
+    # 03:00Z on the 8th, stored with a -07:00 offset, must stay inside the range.
+    assert lower <= "2026-10-07T20:00:00-07:00" <= upper
+
+
 def test_sum_recording_durations_for_utc_date_uses_created_at_index(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -497,28 +837,37 @@ def test_team_name_exists_raises_when_attr_missing(monkeypatch: pytest.MonkeyPat
         dynamodb.team_name_exists(MagicMock(), "Team")
 
 
-def test_team_name_exists_true_when_query_returns_item() -> None:
+def test_team_name_exists_true_when_query_counts_item() -> None:
     teams_table = MagicMock()
-    teams_table.query.return_value = {"Items": [{"teamName": "T"}]}
+    teams_table.query.return_value = {"Count": 1}
     assert dynamodb.team_name_exists(teams_table, "T") is True
+    assert teams_table.query.call_args.kwargs["Select"] == "COUNT"
 
 
-def test_team_name_exists_uses_scan_when_query_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_team_name_exists_trusts_empty_index_query(monkeypatch: pytest.MonkeyPatch) -> None:
     teams_table = MagicMock()
-    teams_table.query.return_value = {"Items": []}
-    teams_table.scan.return_value = {"Items": [{"teamName": "T"}]}
+    teams_table.query.return_value = {"Count": 0}
 
-    assert dynamodb.team_name_exists(teams_table, "T") is True
-    teams_table.scan.assert_called_once()
+    assert dynamodb.team_name_exists(teams_table, "T") is False
+    teams_table.scan.assert_not_called()
 
 
-def test_team_name_exists_fallback_on_allowed_client_error(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_team_name_exists_requires_name_index(monkeypatch: pytest.MonkeyPatch) -> None:
     teams_table = MagicMock()
     teams_table.query.side_effect = make_client_error("ValidationException")
-    teams_table.scan.return_value = {"Items": [{"teamName": "T"}]}
 
-    assert dynamodb.team_name_exists(teams_table, "T") is True
-    teams_table.scan.assert_called_once()
+    with pytest.raises(RuntimeError):
+        dynamodb.team_name_exists(teams_table, "T")
+    teams_table.scan.assert_not_called()
+
+
+def test_get_team_by_name_requires_name_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    teams_table = MagicMock()
+    teams_table.query.side_effect = make_client_error("ResourceNotFoundException")
+
+    with pytest.raises(RuntimeError):
+        dynamodb.get_team_by_name(teams_table, "T")
+    teams_table.scan.assert_not_called()
 
 
 def test_team_name_exists_reraises_unexpected_client_error(monkeypatch: pytest.MonkeyPatch) -> None:
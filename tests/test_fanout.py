@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from rowlytics_app.services import fanout
+
+
+def test_run_fanout_preserves_input_order() -> None:
+    assert fanout.run_fanout(lambda value: value * 2, [3, 1, 2]) == [6, 2, 4]
+
+
+def test_run_fanout_runs_single_item_inline() -> None:
+    caller = threading.get_ident()
+    assert fanout.run_fanout(lambda _item: threading.get_ident(), ["only"]) == [caller]
+
+
+def test_run_fanout_propagates_errors() -> None:
+    def fail(item):
+        if item == "bad":
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError):
+        fanout.run_fanout(fail, ["ok", "bad"])
+
+
+def test_run_fanout_reuses_one_executor() -> None:
+    fanout.run_fanout(lambda value: value, [1, 2])
+    executor = fanout._executor
+    fanout.run_fanout(lambda value: value, [3, 4])
+    assert executor is not None
+    assert fanout._executor is executor
+
+
+def test_run_fanout_runs_nested_calls_inline() -> None:
+    def nested(_item):
+        worker = threading.get_ident()
+        return fanout.run_fanout(lambda _inner: threading.get_ident() == worker, [1, 2])
+
+    assert fanout.run_fanout(nested, ["a", "b"]) == [[True, True], [True, True]]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify, request
+
+from rowlytics_app import create_app
+from rowlytics_app.json_provider import OrjsonProvider
+
+pytest.importorskip("orjson")
+
+
+@pytest.fixture()
+def app() -> Flask:
+    flask_app = create_app()
+    flask_app.config.update(TESTING=True, AUTH_REQUIRED=False)
+    return flask_app
+
+
+def test_create_app_installs_orjson_provider(app: Flask) -> None:
+    assert isinstance(app.json, OrjsonProvider)
+
+
+def test_orjson_provider_matches_default_encoding(app: Flask) -> None:
+    payload = {
+        "b": Decimal("81.5"),
+        "a": datetime(2026, 4, 5, 10, 0, tzinfo=timezone.utc),
+        "nested": {"score": Decimal("7")},
+    }
+
+    with app.app_context():
+        body = jsonify(payload).get_data()
+
+    assert body == b'{"a":"Sun, 05 Apr 2026 10:00:00 GMT","b":"81.5","nested":{"score":"7"}}\n'
+
+
+def test_orjson_provider_falls_back_for_unsupported_values(app: Flask) -> None:
+    big = 2 ** 70
+    with app.app_context():
+        assert json.loads(app.json.dumps({"value": big})) == {"value": big}
+        assert json.loads(jsonify({"value": big}).get_data()) == {"value": big}
+
+
+def test_orjson_provider_parses_request_bodies(app: Flask) -> None:
+    with app.test_request_context(json={"name": "Rower", "durationSec": 5.5}):
+        assert request.get_json() == {"name": "Rower", "durationSec": 5.5}
+
+    with app.test_request_context(data=b"{not json", content_type="application/json"):
+        assert request.get_json(silent=True) is None
@@ -54,4 +54,13 @@ def test_lambda_handler_calls_awsgi_response(monkeypatch: pytest.MonkeyPatch) ->
     assert args[0] is lambda_app.app
     assert args[1]["headers"] == {}
     assert args[2] is ctx
-    assert "base64_content_types" in kwargs
+    assert kwargs["base64_content_types"] is lambda_app.BASE64_CONTENT_TYPES
+
+
+def test_inject_stage_prefix_matches_existing_header_case_insensitively() -> None:
+    event = {
+        "requestContext": {"stage": "prod"},
+        "headers": {"x-forwarded-prefix": "/api"},
+    }
+    result = lambda_app._inject_stage_prefix(event)
+    assert result["headers"] == {"x-forwarded-prefix": "/api"}
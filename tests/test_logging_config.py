@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from rowlytics_app.logging_config import JsonFormatter
+
+
+def test_json_formatter_emits_parseable_record() -> None:
+    record = logging.LogRecord(
+        name="rowlytics.test",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=12,
+        msg="joined team %s",
+        args=("Crew",),
+        exc_info=None,
+    )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["level"] == "WARNING"
+    assert payload["logger"] == "rowlytics.test"
+    assert payload["message"] == "joined team Crew"
+    assert payload["line"] == 12
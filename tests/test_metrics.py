@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import rowlytics_app.services.metrics as metrics
+
+
+def test_publish_login_latency_builds_client_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    boto = MagicMock()
+    monkeypatch.setattr(metrics, "boto3", boto)
+
+    metrics.publish_login_latency(latency_ms=12.5, environment="test")
+    metrics.publish_login_latency(latency_ms=8.0, environment="test")
+
+    boto.client.assert_called_once_with(
+        "cloudwatch",
+        region_name="us-east-2",
+        config=metrics.AWS_CLIENT_CONFIG,
+    )
+    put_metric_data = boto.client.return_value.put_metric_data
+    assert put_metric_data.call_count == 2
+    metric = put_metric_data.call_args.kwargs["MetricData"][0]
+    assert metric["MetricName"] == "LoginLatencyMs"
+    assert metric["Value"] == 8.0
+
+
+def test_publish_login_latency_requires_boto3(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(metrics, "boto3", None)
+    with pytest.raises(RuntimeError):
+        metrics.publish_login_latency(latency_ms=1.0, environment="test")
@@ -1,13 +1,18 @@
 """Tests for recording upload API validation."""
 from __future__ import annotations
 
+import base64
+import json
+import re
+import time
 from unittest.mock import MagicMock
 
 import pytest
-from flask import Flask
+from flask import Flask, g
 from flask.testing import FlaskClient
 
 from rowlytics_app import create_app
+from rowlytics_app.api_routes import _decode_cursor, _encode_cursor, _resolve_recording_user_id
 
 
 @pytest.fixture()
@@ -236,3 +241,100 @@ def test_list_recordings_for_user_rejects_partial_created_at_range(
     assert response.status_code == 400
     assert response.get_json()["error"] == "createdFrom and createdTo must be provided together"
     get_recordings_table.assert_not_called()
+
+
+def test_list_recordings_for_user_presigns_each_clip_in_order(
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    s3 = MagicMock()
+    s3.generate_presigned_url.side_effect = (
+        lambda _operation, Params, ExpiresIn: f"https://example.test/{Params['Key']}"
+    )
+    items = [{"recordingId": f"rec-{idx}", "objectKey": f"clip-{idx}.webm"} for idx in range(5)]
+    items.insert(2, {"recordingId": "rec-missing"})
+
+    monkeypatch.setattr("rowlytics_app.api_routes.get_recordings_table", MagicMock)
+    monkeypatch.setattr("rowlytics_app.api_routes.get_s3_client", lambda: s3)
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.list_recordings_page",
+        lambda _table, **_kwargs: (items, None),
+    )
+
+    response = client.get("/api/recordings/user-123")
+
+    assert response.status_code == 200
+    urls = [item["playbackUrl"] for item in response.get_json()["recordings"]]
+    assert urls == [
+        "https://example.test/clip-0.webm",
+        "https://example.test/clip-1.webm",
+        None,
+        "https://example.test/clip-2.webm",
+        "https://example.test/clip-3.webm",
+        "https://example.test/clip-4.webm",
+    ]
+
+
+def test_presign_recording_upload_builds_timestamped_object_key(
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    s3 = MagicMock()
+    s3.generate_presigned_url.return_value = "https://example.test/upload"
+    monkeypatch.setattr("rowlytics_app.api_routes.get_s3_client", lambda: s3)
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.time.gmtime",
+        lambda: time.struct_time((2026, 4, 5, 9, 7, 3, 6, 95, 0)),
+    )
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-123"
+
+    response = client.post("/api/recordings/presign", json={"contentType": "video/webm"})
+
+    assert response.status_code == 200
+    object_key = response.get_json()["objectKey"]
+    prefix, suffix = object_key.rsplit("-", 1)
+    assert prefix == "recordings/user-123/20260405T090703Z"
+    assert re.fullmatch(r"[0-9a-f]{32}\.webm", suffix)
+
+
+def test_cursor_round_trips_without_padding_and_accepts_padded_cursors() -> None:
+    key = {"userId": "user-1", "recordingId": "rec-1", "createdAt": "2024-01-01T00:00:00"}
+
+    cursor = _encode_cursor(key)
+
+    assert "=" not in cursor
+    assert _decode_cursor(cursor) == key
+    legacy = base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+    assert _decode_cursor(legacy) == key
+    with pytest.raises(ValueError):
+        _decode_cursor("not-a-cursor")
+
+
+def test_list_recordings_for_user_answers_matching_etag_with_304(
+    client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    s3 = MagicMock()
+    s3.generate_presigned_url.return_value = "https://example.test/clip.webm"
+    monkeypatch.setattr("rowlytics_app.api_routes.get_recordings_table", MagicMock)
+    monkeypatch.setattr("rowlytics_app.api_routes.get_s3_client", lambda: s3)
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.list_recordings_page",
+        lambda _table, **_kwargs: ([{"recordingId": "rec-1", "objectKey": "clip.webm"}], None),
+    )
+
+    first = client.get("/api/recordings/user-123")
+    etag = first.headers["ETag"]
+    second = client.get("/api/recordings/user-123", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.get_data() == b""
+
+
+def test_resolve_recording_user_id_prefers_authenticated_user_on_g(app: Flask) -> None:
+    with app.test_request_context():
+        g.user_id = "user-from-g"
+        assert _resolve_recording_user_id({"userId": "someone-else"}) == "user-from-g"
@@ -29,4 +29,50 @@ def test_get_s3_client_returns_boto_client(monkeypatch: pytest.MonkeyPatch) -> N
     result = s3.get_s3_client()
 
     assert result is client
-    boto.client.assert_called_once_with("s3")
+    boto.client.assert_called_once_with("s3", config=s3.AWS_CLIENT_CONFIG)
+
+
+def test_get_s3_client_is_cached_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    boto = MagicMock()
+    monkeypatch.setattr(s3, "boto3", boto)
+    monkeypatch.setattr(s3, "UPLOAD_BUCKET_NAME", "rowlyticsuploads")
+
+    assert s3.get_s3_client() is s3.get_s3_client()
+    boto.client.assert_called_once_with("s3", config=s3.AWS_CLIENT_CONFIG)
+
+
+def test_presign_playback_url_reuses_recent_signature() -> None:
+    client = MagicMock()
+    client.generate_presigned_url.side_effect = ["https://signed/1", "https://signed/2"]
+
+    assert s3.presign_playback_url(client, "recordings/a.webm") == "https://signed/1"
+    assert s3.presign_playback_url(client, "recordings/a.webm") == "https://signed/1"
+    client.generate_presigned_url.assert_called_once_with(
+        "get_object",
+        Params={"Bucket": s3.UPLOAD_BUCKET_NAME, "Key": "recordings/a.webm"},
+        ExpiresIn=s3.PLAYBACK_URL_EXPIRES_SECONDS,
+    )
+
+
+def test_delete_object_keys_chunks_requests_and_reports_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(s3, "DELETE_OBJECTS_MAX_KEYS", 2)
+    client = MagicMock()
+    client.delete_objects.side_effect = [{"Errors": [{"Key": "b"}]}, {}]
+
+    assert s3.delete_object_keys(client, ["a", "b", "c"]) == ["b"]
+    batches = [
+        [obj["Key"] for obj in call.kwargs["Delete"]["Objects"]]
+        for call in client.delete_objects.call_args_list
+    ]
+    assert batches == [["a", "b"], ["c"]]
+
+
+def test_aws_client_config_enables_keepalive_and_pool_headroom() -> None:
+    config = s3.AWS_CLIENT_CONFIG
+
+    assert config.tcp_keepalive is True
+    assert config.max_pool_connections >= 10
+    assert config.retries == {"mode": "standard", "max_attempts": 3}
+    assert config.connect_timeout == 2
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import rowlytics_app.services.ses_email as ses_email
+
+
+def test_send_email_reuses_client_per_region(monkeypatch: pytest.MonkeyPatch) -> None:
+    boto = MagicMock()
+    boto.client.return_value.send_email.return_value = {"MessageId": "m-1"}
+    monkeypatch.setattr(ses_email, "boto3", boto)
+    monkeypatch.setenv("AWS_REGION", "us-east-2")
+    monkeypatch.setenv("SES_FROM_EMAIL", "noreply@example.com")
+
+    assert ses_email.send_email("a@example.com", "Hi", "Body") == "m-1"
+    assert ses_email.send_email("b@example.com", "Hi", "Body") == "m-1"
+
+    boto.client.assert_called_once_with(
+        "ses",
+        region_name="us-east-2",
+        config=ses_email.AWS_CLIENT_CONFIG,
+    )
+    assert boto.client.return_value.send_email.call_count == 2
+
+
+def test_send_email_requires_from_address(monkeypatch: pytest.MonkeyPatch) -> None:
+    boto = MagicMock()
+    monkeypatch.setattr(ses_email, "boto3", boto)
+    monkeypatch.delenv("SES_FROM_EMAIL", raising=False)
+
+    with pytest.raises(ValueError):
+        ses_email.send_email("a@example.com", "Hi", "Body")
+    boto.client.assert_not_called()
@@ -0,0 +1,299 @@
+"""Tests for team membership API routes."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+from flask import Flask
+from flask.testing import FlaskClient
+
+from rowlytics_app import create_app
+
+
+def make_cancelled_transaction(*codes: str) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": [{"Code": code} for code in codes],
+        },
+        "TransactWriteItems",
+    )
+
+
+@pytest.fixture()
+def app() -> Flask:
+    flask_app = create_app()
+    flask_app.config.update(TESTING=True, AUTH_REQUIRED=False)
+    return flask_app
+
+
+@pytest.fixture()
+def client(app: Flask) -> FlaskClient:
+    return app.test_client()
+
+
+@pytest.fixture()
+def tables(monkeypatch: pytest.MonkeyPatch) -> dict:
+    tables = {
+        "users": MagicMock(),
+        "team_members": MagicMock(),
+        "teams": MagicMock(),
+    }
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_ddb_tables",
+        lambda: (tables["users"], tables["team_members"]),
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.get_teams_table", lambda: tables["teams"])
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.resolve_user_by_identifier",
+        lambda _table, identifier: {"userId": identifier},
+    )
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_team_membership",
+        lambda _table, _user_id, **_kwargs: None,
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.fetch_user_profile", lambda _user_id: {})
+    return tables
+
+
+def test_add_team_member_writes_membership_in_one_transaction(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.put_team_membership",
+        lambda teams_table, members_table, item: calls.append((teams_table, members_table, item)),
+    )
+
+    response = client.post("/api/teams/team-1/members", json={"userId": "user-2"})
+
+    assert response.status_code == 201
+    assert len(calls) == 1
+    teams_table, members_table, item = calls[0]
+    assert teams_table is tables["teams"]
+    assert members_table is tables["team_members"]
+    assert item["teamId"] == "team-1"
+    assert item["userId"] == "user-2"
+    assert item["memberRole"] == "rower"
+
+
+@pytest.mark.parametrize(
+    ("codes", "status", "error"),
+    [
+        (("ConditionalCheckFailed", "None"), 404, "Team not found"),
+        (("None", "ConditionalCheckFailed"), 409, "User already on team"),
+    ],
+)
+def test_add_team_member_maps_transaction_cancellation_reasons(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+    codes: tuple[str, str],
+    status: int,
+    error: str,
+) -> None:
+    def fail(*_args):
+        raise make_cancelled_transaction(*codes)
+
+    monkeypatch.setattr("rowlytics_app.api_routes.put_team_membership", fail)
+
+    response = client.post("/api/teams/team-1/members", json={"userId": "user-2"})
+
+    assert response.status_code == status
+    assert response.get_json()["error"] == error
+
+
+def test_create_team_rejects_non_string_team_name(client: FlaskClient) -> None:
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+
+    response = client.post("/api/team/create", json={"teamName": 42})
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "teamName is required"}
+
+
+def test_join_team_returns_first_members_page(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_team_by_name",
+        lambda _table, _name: {"teamId": "team-1"},
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.put_team_membership", lambda *_args: None)
+    page_calls = []
+
+    def fake_page(_users, _members, team_id, _roles, *, limit):
+        page_calls.append((team_id, limit))
+        return [{"userId": "user-1"}], {"teamId": "team-1", "userId": "user-1"}
+
+    monkeypatch.setattr("rowlytics_app.api_routes.fetch_team_members_page", fake_page)
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+
+    response = client.post("/api/team/join?limit=1", json={"teamName": "Crew"})
+
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["members"] == [{"userId": "user-1"}]
+    assert payload["nextCursor"]
+    assert page_calls == [("team-1", 1)]
+
+
+def test_create_team_reports_membership_before_name_conflict(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.get_team_membership",
+        lambda _table, _user_id, **_kwargs: {"teamId": "team-9"},
+    )
+    monkeypatch.setattr("rowlytics_app.api_routes.team_name_exists", lambda _table, _name: True)
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+
+    response = client.post("/api/team/create", json={"teamName": "Crew"})
+
+    assert response.status_code == 409
+    assert response.get_json()["teamId"] == "team-9"
+    tables["teams"].put_item.assert_not_called()
+
+
+def test_create_team_writes_team_and_owner_in_one_transaction(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("rowlytics_app.api_routes.team_name_exists", lambda _table, _name: False)
+    calls = []
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.put_team_with_owner",
+        lambda _teams, _members, team_item, member_item: calls.append((team_item, member_item)),
+    )
+
+    def fail_page(*_args, **_kwargs):
+        raise AssertionError("a new team's roster should not be re-read")
+
+    monkeypatch.setattr("rowlytics_app.api_routes.fetch_team_members_page", fail_page)
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.fetch_user_profile",
+        lambda _user_id: {"userId": "user-1", "name": "Coach One", "email": "coach@example.com"},
+    )
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+
+    response = client.post("/api/team/create", json={"teamName": "Crew"})
+
+    assert response.status_code == 201
+    payload = response.get_json()
+    assert payload["nextCursor"] is None
+    assert payload["members"] == [{
+        "userId": "user-1",
+        "memberRole": "coach",
+        "joinedAt": calls[0][1]["joinedAt"],
+        "name": "Coach One",
+        "email": "coach@example.com",
+        "emailUpdateFrequency": "weekly",
+    }]
+    team_item, member_item = calls[0]
+    assert team_item["teamName"] == "Crew"
+    assert team_item["coachUserId"] == "user-1"
+    assert member_item["teamId"] == team_item["teamId"] == response.get_json()["teamId"]
+    assert member_item["memberRole"] == "coach"
+    tables["teams"].put_item.assert_not_called()
+
+
+def test_create_team_normalizes_client_created_at(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("rowlytics_app.api_routes.team_name_exists", lambda _table, _name: False)
+    calls = []
+    monkeypatch.setattr(
+        "rowlytics_app.api_routes.put_team_with_owner",
+        lambda _teams, _members, team_item, member_item: calls.append((team_item, member_item)),
+    )
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+
+    numeric = client.post("/api/team/create", json={"teamName": "Crew", "createdAt": 1700000000})
+    offset = client.post(
+        "/api/team/create",
+        json={"teamName": "Crew 2", "createdAt": "2026-10-07T20:00:00-07:00"},
+    )
+
+    assert numeric.status_code == offset.status_code == 201
+    assert isinstance(calls[0][0]["createdAt"], str)
+    assert calls[1][0]["createdAt"] == "2026-10-08T03:00:00+00:00"
+    assert calls[1][1]["joinedAt"] == calls[1][0]["createdAt"]
+
+
+def test_create_team_falls_back_to_session_when_profile_unavailable(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("rowlytics_app.api_routes.team_name_exists", lambda _table, _name: False)
+    monkeypatch.setattr("rowlytics_app.api_routes.put_team_with_owner", lambda *_args: None)
+
+    def fail_profile(_user_id):
+        raise RuntimeError("throttled")
+
+    monkeypatch.setattr("rowlytics_app.api_routes.fetch_user_profile", fail_profile)
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+        session["user_name"] = "Coach One"
+
+    response = client.post("/api/team/create", json={"teamName": "Crew"})
+
+    assert response.status_code == 201
+    (owner,) = response.get_json()["members"]
+    assert owner["name"] == "Coach One"
+    assert owner["emailUpdateFrequency"] == "weekly"
+
+
+@pytest.mark.parametrize(
+    ("codes", "status"),
+    [
+        (("None", "ConditionalCheckFailed"), 409),
+        (("ConditionalCheckFailed", "None"), 500),
+    ],
+)
+def test_create_team_maps_transaction_cancellation_reasons(
+    client: FlaskClient,
+    tables: dict,
+    monkeypatch: pytest.MonkeyPatch,
+    codes: tuple[str, str],
+    status: int,
+) -> None:
+    monkeypatch.setattr("rowlytics_app.api_routes.team_name_exists", lambda _table, _name: False)
+
+    def fail(*_args):
+        raise make_cancelled_transaction(*codes)
+
+    monkeypatch.setattr("rowlytics_app.api_routes.put_team_with_owner", fail)
+
+    with client.session_transaction() as session:
+        session["user_id"] = "user-1"
+
+    response = client.post("/api/team/create", json={"teamName": "Crew"})
+
+    assert response.status_code == status
+    if status == 409:
+        assert response.get_json() == {
+            "error": "Already on a team. Leave your current team first.",
+        }
+    else:
+        assert response.get_json()["error"] == "Unable to create team"
@@ -105,7 +105,7 @@ def test_weekly_team_stats_returns_user_and_team_aggregates(
     )
     monkeypatch.setattr(
         "rowlytics_app.api_routes.list_workouts",
-        lambda workouts_table, user_id: workouts_by_user[user_id],
+        lambda workouts_table, user_id, **_kwargs: workouts_by_user[user_id],
     )
 
     with client.session_transaction() as session:
@@ -179,7 +179,7 @@ def test_weekly_team_stats_returns_empty_team_state_when_user_has_no_team(
     )
     monkeypatch.setattr(
         "rowlytics_app.api_routes.list_workouts",
-        lambda workouts_table, user_id: [
+        lambda workouts_table, user_id, **_kwargs: [
             {
                 "workoutId": "solo-1",
                 "completedAt": "2026-04-22T14:00:00+00:00",